@@ -34,8 +34,10 @@ def run() -> None:
 
     window: MainWindow = MainWindow(application=app)
     argv: str
-    for argv in sys.argv[1:]:
-        if window.load_file(QtCore.QUrl(argv).path()):
-            break
+    file_names: list[str] = [QtCore.QUrl(argv).path() for argv in sys.argv[1:]]
+    if len(file_names) == 1:  # a file or a directory
+        window.load_file(file_names[0])
+    else:
+        window.load_files(file_names)
     window.show()
     app.exec()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from pyqtgraph.Qt import QtCore
+
+__all__ = ['BackgroundWorker', 'TaskCancelled']
+
+
+class TaskCancelled(Exception):
+    """ Raised by the `progress` function of a task that has been cancelled, to stop the task """
+
+
+class _Task(QtCore.QRunnable):
+    def __init__(self, worker: BackgroundWorker, key: Any, function: Callable[..., Any],
+                 args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        super().__init__()
+        self._worker: BackgroundWorker = worker
+        self.key: Any = key
+        self._function: Callable[..., Any] = function
+        self._args: tuple[Any, ...] = args
+        self._kwargs: dict[str, Any] = kwargs
+        self.cancelled: bool = False
+
+    def progress(self, done: int, total: int) -> None:
+        if self.cancelled:
+            raise TaskCancelled
+        self._worker.progress.emit(done, total)
+
+    def run(self) -> None:
+        try:
+            result: Any = self._function(*self._args, progress=self.progress, **self._kwargs)
+        except TaskCancelled:
+            pass
+        except Exception as ex:  # not to leave the worker busy forever, whatever the function raises
+            self._worker.taskFinished.emit(self, None, ex)
+        else:
+            self._worker.taskFinished.emit(self, result, None)
+
+
+class BackgroundWorker(QtCore.QObject):
+    """
+    Call a function in a background thread, one at a time, reporting the progress
+
+    The results and the exceptions come along with the key given to `start`, for the receiver to tell what they are of.
+    """
+
+    started: QtCore.Signal = QtCore.Signal(name='started')
+    # the amount of work done and the total amount; not `int`, for the sizes of large files overflow a C `int`
+    progress: QtCore.Signal = QtCore.Signal(object, object, name='progress')
+    finished: QtCore.Signal = QtCore.Signal(object, object, name='finished')  # the key and the result
+    failed: QtCore.Signal = QtCore.Signal(object, object, name='failed')  # the key and the exception
+    cancelled: QtCore.Signal = QtCore.Signal(name='cancelled')
+    # emitted with the key and the result of a task cancelled too late to stop it
+    lateFinished: QtCore.Signal = QtCore.Signal(object, object, name='lateFinished')
+    taskFinished: QtCore.Signal = QtCore.Signal(object, object, object, name='taskFinished')  # emitted by the task
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self._task: Optional[_Task] = None
+
+        self.taskFinished.connect(self.on_task_finished)
+
+    def start(self, key: Any, function: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Call `function(*args, progress=..., **kwargs)` in a background thread, cancelling the call under way
+        :param key: what the call is about, to be emitted along with the result
+        :param function: the function to call; it should call the `progress` function it gets with the amount of work
+                         done and the total amount of work every now and then, which raises `TaskCancelled`
+                         after `cancel` is called
+        """
+        self.cancel()
+        self._task = _Task(self, key, function, args, kwargs)
+        QtCore.QThreadPool.globalInstance().start(self._task)
+        self.started.emit()
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancelled = True
+            self._task = None
+            self.cancelled.emit()
+
+    def on_task_finished(self, task: _Task, result: Any, ex: Optional[Exception]) -> None:
+        if task is not self._task:  # cancelled
+            if ex is None:
+                self.lateFinished.emit(task.key, result)
+            return
+        self._task = None
+        if ex is not None:
+            self.failed.emit(task.key, ex)
+        else:
+            self.finished.emit(task.key, result)
@@ -1,61 +1,178 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import functools
-from datetime import datetime
-from typing import Final, Optional, cast
+from collections import OrderedDict
+from typing import Final, NamedTuple, Optional, Sequence, cast
 
 import numpy as np
 from numpy.typing import NDArray
 from pyqtgraph.Qt import QtCore
 
-__all__ = ['DataModel']
+from gui._formatters import Formatter, column_formatter, format_integers
+from log_parser import ChannelSummary, ChunkedArray, ChunkedColumn
+from log_parser._parser import _time_channel
 
+__all__ = ['ColumnStatistics', 'DataModel']
 
-@functools.lru_cache(maxsize=128, typed=True)
-def format_float(value: np.float64, precision: int = 12) -> str:
-    return f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+
+class ColumnStatistics(NamedTuple):
+    """ A summary of a data column that is kept up to date as the rows are appended """
+
+    count: int
+    nan_count: int
+    nonzero_count: int  # NaN excluded
+    min: float  # NaN if there are no numbers in the column
+    max: float
+    sum: float
+    first_timestamp: float  # of the first number in the column, NaN if there are no numbers
+    last_timestamp: float  # of the last number in the column
+
+    @property
+    def all_zero(self) -> bool:
+        """ Whether the column is all zeros or NaN """
+        return not self.nonzero_count
+
+    @property
+    def mean(self) -> float:
+        if self.count == self.nan_count:
+            return np.nan
+        return self.sum / (self.count - self.nan_count)
+
+    @classmethod
+    def of(cls, values: NDArray[np.float64] | ChunkedColumn,
+           timestamps: Optional[NDArray[np.float64] | ChunkedColumn]) -> ColumnStatistics:
+        """
+        Compute the statistics of a column
+        :param values: the column values; the chunks of a `ChunkedColumn` are summarized one by one, without joining
+        :param timestamps: the timestamps of the values, or None if they are unknown
+        :return: the statistics
+        """
+        return cls.of_summary(ChannelSummary.of(values), timestamps)
+
+    @classmethod
+    def of_summary(cls, summary: ChannelSummary,
+                   timestamps: Optional[NDArray[np.float64] | ChunkedColumn]) -> ColumnStatistics:
+        """
+        Get the statistics of a column from its summary, e.g., the one made by `FileLoader`, without scanning the column
+        :param summary: the summary of the column values
+        :param timestamps: the timestamps of the values, or None if they are unknown
+        :return: the statistics
+        """
+        return cls(count=summary.count, nan_count=summary.nan_count, nonzero_count=summary.nonzero_count,
+                   min=summary.min, max=summary.max, sum=summary.sum,
+                   first_timestamp=(float(timestamps[summary.first_index])
+                                    if timestamps is not None and summary.first_index >= 0 else np.nan),
+                   last_timestamp=(float(timestamps[summary.last_index])
+                                   if timestamps is not None and summary.last_index >= 0 else np.nan))
+
+    def merged(self, other: ColumnStatistics) -> ColumnStatistics:
+        """ Get the statistics of the column made of the rows of `self` followed by the rows of `other` """
+        return ColumnStatistics(count=self.count + other.count,
+                                nan_count=self.nan_count + other.nan_count,
+                                nonzero_count=self.nonzero_count + other.nonzero_count,
+                                min=float(np.fmin(self.min, other.min)), max=float(np.fmax(self.max, other.max)),
+                                sum=self.sum + other.sum,
+                                first_timestamp=(self.first_timestamp if self.count > self.nan_count
+                                                 else other.first_timestamp),
+                                last_timestamp=(other.last_timestamp if other.count > other.nan_count
+                                                else self.last_timestamp))
+
+
+def _all_zeros(values: NDArray[np.float64], chunk_size: int = 1 << 16) -> bool:
+    """ Check the values by chunks not to scan the whole array when there is a non-zero value near its start """
+    start: int
+    return not any(np.any(values[start:start + chunk_size]) for start in range(0, values.size, chunk_size))
 
 
 class DataModel(QtCore.QAbstractTableModel):
-    ROW_BATCH_COUNT: Final[int] = 96
+    ROW_BATCH_COUNT: Final[int] = 96  # rows shown at once if `fetch_rows_in_batches` is set
+    FORMATTED_BLOCK_SIZE: Final[int] = 256  # rows formatted at once
+    MAX_FORMATTED_BLOCKS_COUNT: Final[int] = 256  # the least recently used blocks of strings are dropped then
+
+    dataAppended: QtCore.Signal = QtCore.Signal(name='dataAppended')
 
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         super().__init__(parent)
-        self._data: NDArray[np.float64] = np.empty((0, 0), dtype=np.float64)
+        # the data as it is given, possibly memory-mapped or made of several files,
+        # or a view of `self._buffer` when rows have been appended
+        self._data: NDArray[np.float64] | ChunkedArray = np.empty((0, 0), dtype=np.float64)
+        self._buffer: NDArray[np.float64] = self._data  # `self._data` is a view of it with spare room for more rows
+        # the channels shown: the line numbers and the channels that are not all zeros
+        self._channels: list[int] = []
+        self._rows: list[int] = []  # the rows of `self._data` holding `self._channels`
+        self._time_index: Optional[int] = None  # the index of the timestamps in `self._channels`, if shown
+        # the views of `self._data` are cached for the frequent access not to create them anew every time
+        self._line_numbers: NDArray[np.float64] | ChunkedColumn = np.empty(0, dtype=np.float64)
+        self._columns: list[NDArray[np.float64] | ChunkedColumn] = []
+        self._statistics: list[ColumnStatistics] = []
+        self._fetch_rows_in_batches: bool = False
         self._rows_loaded: int = self.ROW_BATCH_COUNT
 
         self._header: list[str] = []
+        self._formatters: list[Formatter] = []
+        # the strings for the blocks of `FORMATTED_BLOCK_SIZE` rows of a column,
+        # by the block index and the column index, which is -1 for the line numbers
+        self._formatted_blocks: OrderedDict[tuple[int, int], list[str]] = OrderedDict()
 
     @property
     def header(self) -> list[str]:
         return self._header
 
     @property
-    def all_data(self) -> NDArray[np.float64]:
-        return self._data[1:]
+    def fetch_rows_in_batches(self) -> bool:
+        """
+        Whether the rows are shown by `ROW_BATCH_COUNT` as the table is scrolled down
+        instead of all of them at once, which is the default, since the data is in memory anyway
+        """
+        return self._fetch_rows_in_batches
+
+    @fetch_rows_in_batches.setter
+    def fetch_rows_in_batches(self, new_value: bool) -> None:
+        if new_value == self._fetch_rows_in_batches:
+            return
+        self.beginResetModel()
+        self._fetch_rows_in_batches = new_value
+        self._rows_loaded = self.ROW_BATCH_COUNT
+        self.endResetModel()
+
+    def column(self, column_index: int) -> NDArray[np.float64] | ChunkedColumn:
+        return self._columns[column_index]
+
+    def formatter(self, column_index: int) -> Formatter:
+        return self._formatters[column_index]
+
+    def statistics(self, column_index: int) -> ColumnStatistics:
+        return self._statistics[column_index]
+
+    def _update_views(self) -> None:
+        row: int
+        self._line_numbers = self._data[self._rows[0]]
+        self._columns = [self._data[row] for row in self._rows[1:]]
 
     def rowCount(self, parent: Optional[QtCore.QModelIndex] = None, *, available_count: bool = False) -> int:
-        if available_count:
+        if available_count or not self._fetch_rows_in_batches:
             return cast(int, self._data.shape[1])
         return min(cast(int, self._data.shape[1]), self._rows_loaded)
 
     def columnCount(self, parent: Optional[QtCore.QModelIndex] = None) -> int:
         return len(self._header)
 
+    def _formatted_block(self, block: int, column: int) -> list[str]:
+        strings: Optional[list[str]] = self._formatted_blocks.get((block, column))
+        if strings is None:
+            formatter: Formatter = format_integers if column < 0 else self._formatters[column]
+            values: NDArray[np.float64] | ChunkedColumn = self._line_numbers if column < 0 else self._columns[column]
+            strings = formatter(values[block * self.FORMATTED_BLOCK_SIZE:(block + 1) * self.FORMATTED_BLOCK_SIZE])
+            self._formatted_blocks[block, column] = strings
+            if len(self._formatted_blocks) > self.MAX_FORMATTED_BLOCKS_COUNT:
+                self._formatted_blocks.popitem(last=False)
+        else:
+            self._formatted_blocks.move_to_end((block, column))
+        return strings
+
     def formatted_item(self, row: int, column: int) -> str:
-        value: np.float64 = self.item(row, column)
-        if np.isnan(value):
-            return ''
-        if self._header[column].endswith(('(s)', '(sec)', '(secs)')):
-            return datetime.fromtimestamp(value).isoformat()
-        if self._header[column].endswith('(K)'):
-            return format_float(value)
-        if self._header[column].endswith('(Bar)'):
-            return format_float(value, precision=3 + int(-np.log10(np.abs(value))))
-        if value.is_integer():
-            return f'{value:.0f}'
-        return format_float(value)
+        block: int = row // self.FORMATTED_BLOCK_SIZE
+        return self._formatted_block(block, column)[row - block * self.FORMATTED_BLOCK_SIZE]
 
     def data(self, index: QtCore.QModelIndex,
              role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole) -> Optional[str]:
@@ -65,16 +182,15 @@ class DataModel(QtCore.QAbstractTableModel):
         return None
 
     def item(self, row_index: int, column_index: int) -> np.float64:
-        return self._data[column_index + 1, row_index]
+        return self._columns[column_index][row_index]
 
     def headerData(self, col: int, orientation: QtCore.Qt.Orientation,
                    role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole) -> Optional[str]:
         if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
             return self._header[col]
-        if (orientation == QtCore.Qt.Orientation.Vertical
-                and role == QtCore.Qt.ItemDataRole.DisplayRole
-                and not np.isnan(self._data[0, col])):
-            return f'{self._data[0, col]:.0f}'
+        if orientation == QtCore.Qt.Orientation.Vertical and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            block: int = col // self.FORMATTED_BLOCK_SIZE
+            return self._formatted_block(block, -1)[col - block * self.FORMATTED_BLOCK_SIZE] or None
         return None
 
     def setHeaderData(self, section: int, orientation: QtCore.Qt.Orientation,
@@ -83,22 +199,114 @@ class DataModel(QtCore.QAbstractTableModel):
                 and role == QtCore.Qt.ItemDataRole.DisplayRole
                 and 0 <= section < len(self._header)):
             self._header[section] = value
+            self._formatters[section] = column_formatter(value)
+            key: tuple[int, int]
+            for key in [key for key in self._formatted_blocks if key[1] == section]:
+                del self._formatted_blocks[key]
             return True
         return False
 
-    def set_data(self, new_data: list[list[float]] | NDArray[np.float],
-                 new_header: Optional[list[str]] = None) -> None:
+    def set_data(self, new_data: list[list[float]] | NDArray[np.float] | ChunkedArray,
+                 new_header: Optional[list[str]] = None,
+                 summaries: Optional[Sequence[ChannelSummary]] = None) -> None:
+        """
+        Show the data, hiding the channels that are all zeros
+        :param new_data: the data, one row per channel, the line numbers first;
+                         an array of `np.float64`, including a memory-mapped one, and a `ChunkedArray` of several files
+                         are used as is, without copying
+        :param new_header: the channel titles, the line numbers first
+        :param summaries: the statistics of every channel of the data, e.g., made by `FileLoader`,
+                          for the data not to be scanned here; `new_header` is needed to tell the timestamps then
+        """
         self.beginResetModel()
-        self._data = np.array(new_data)
-        good: NDArray[np.bool] = ~np.all(self._data == 0.0, axis=1)
-        self._data = self._data[good]
+        self._data = new_data if isinstance(new_data, ChunkedArray) else np.asarray(new_data, dtype=np.float64)
+        if not self._data.shape[0]:  # not even the line numbers
+            self._data = np.empty((1, 0), dtype=np.float64)
+        self._buffer = self._data
+        channel: int
+        # the channels of a file with no records yet are all kept, for nothing is known of them
+        self._channels = [0] + [channel for channel in range(1, self._data.shape[0])
+                                if not self._data.shape[1]
+                                or not (summaries[channel].all_zeros if summaries is not None
+                                        else _all_zeros(self._data[channel]))]
+        self._rows = self._channels[:]
+        time_channel: Optional[int] = _time_channel(new_header) if new_header is not None else None
+        self._time_index = self._channels.index(time_channel) if time_channel in self._channels else None
+        self._update_views()
+        timestamps: Optional[NDArray[np.float64] | ChunkedColumn] = (self._data[time_channel]
+                                                                     if self._time_index is not None else None)
+        if summaries is not None:
+            self._statistics = [ColumnStatistics.of_summary(summaries[channel], timestamps)
+                                for channel in self._channels[1:]]
+        else:
+            self._statistics = [ColumnStatistics.of(column, timestamps) for column in self._columns]
         if new_header is not None:
-            self._header = [str(s) for s, g in zip(new_header, good) if g][1:]
+            self._header = [str(new_header[channel]) for channel in self._channels[1:]]
+            self._formatters = [column_formatter(title) for title in self._header]
+        self._formatted_blocks.clear()
         self._rows_loaded = self.ROW_BATCH_COUNT
         self.endResetModel()
 
+    def append_data(self, new_data: list[list[float]] | NDArray[np.float],
+                    summaries: Optional[Sequence[ChannelSummary]] = None) -> None:
+        """
+        Show more rows
+        :param new_data: the rows, one row per channel, the channels being the ones given to `set_data`
+        :param summaries: the statistics of every channel of the rows, e.g., made by `FileLoader`,
+                          for the rows not to be scanned here
+        """
+        new_data = np.asarray(new_data)
+        if not new_data.size:
+            return
+        new_data = new_data[self._channels]
+        timestamps: Optional[NDArray[np.float64]] = new_data[self._time_index] if self._time_index is not None else None
+        channel: int
+        new_statistics: list[ColumnStatistics] = (
+            [ColumnStatistics.of_summary(summaries[channel], timestamps) for channel in self._channels[1:]]
+            if summaries is not None
+            else [ColumnStatistics.of(column, timestamps) for column in new_data[1:]])
+        old_rows_count: int = self._data.shape[1]
+        new_rows_count: int = old_rows_count + new_data.shape[1]
+        if new_rows_count > self._buffer.shape[1]:
+            # grow geometrically for the appending to take amortized constant time per row;
+            # the buffer holds only the channels shown, and the data given to `set_data` is never written to;
+            # the chunks of a `ChunkedArray` get joined here
+            new_buffer: NDArray[np.float64] = np.empty((len(self._channels), max(new_rows_count,
+                                                                                 2 * self._buffer.shape[1])),
+                                                       dtype=np.float64)
+            index: int
+            row: int
+            for index, row in enumerate(self._rows):
+                new_buffer[index, :old_rows_count] = self._data[row]
+            self._buffer = new_buffer
+            self._rows = list(range(len(self._channels)))
+        self._buffer[:, old_rows_count:new_rows_count] = new_data
+        statistics: ColumnStatistics
+        new_column_statistics: ColumnStatistics
+        self._statistics = [statistics.merged(new_column_statistics)
+                            for statistics, new_column_statistics in zip(self._statistics, new_statistics)]
+        # the last block might have been formatted incomplete
+        key: tuple[int, int]
+        for key in [key for key in self._formatted_blocks if key[0] >= old_rows_count // self.FORMATTED_BLOCK_SIZE]:
+            del self._formatted_blocks[key]
+        if not self._fetch_rows_in_batches:
+            self.beginInsertRows(QtCore.QModelIndex(), old_rows_count, new_rows_count - 1)
+            self._data = self._buffer[:, :new_rows_count]
+            self._update_views()
+            self.endInsertRows()
+        elif old_rows_count < self._rows_loaded:
+            self.beginInsertRows(QtCore.QModelIndex(),
+                                 old_rows_count, min(new_rows_count, self._rows_loaded) - 1)
+            self._data = self._buffer[:, :new_rows_count]
+            self._update_views()
+            self.endInsertRows()
+        else:
+            self._data = self._buffer[:, :new_rows_count]
+            self._update_views()
+        self.dataAppended.emit()
+
     def canFetchMore(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
-        return bool(self._data.shape[1] > self._rows_loaded)
+        return self._fetch_rows_in_batches and bool(self._data.shape[1] > self._rows_loaded)
 
     def fetchMore(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> None:
         reminder: int = self._data.shape[1] - self._rows_loaded
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Final, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ['MinMaxPyramid']
+
+
+class MinMaxPyramid:
+    """
+    Precomputed min/max decimation of a curve for drawing only about two points per pixel
+
+    Every level holds the minimum and the maximum of `y` over the bins `FACTOR` times larger than the bins of the level
+    below it, so the peaks are kept at any zoom, unlike with a naïve subsampling.
+    The minimum of a bin is drawn at the first `x` of the bin and the maximum at the last one,
+    for the decimated curve to span the same range as the original one.
+    The pyramids of the curves sharing `x` may share its levels too, see `like`.
+    """
+
+    FACTOR: Final[int] = 4
+    MIN_BINS_COUNT: Final[int] = 256  # the coarsest level has no fewer bins
+
+    def __init__(self, x: NDArray[np.float64], y: NDArray[np.float64], like: Optional[MinMaxPyramid] = None) -> None:
+        """
+        :param x: the abscissas of the curve, sorted
+        :param y: the ordinates of the curve
+        :param like: a pyramid of another curve with the same `x` to take the decimated `x` from instead of computing
+        """
+        self._x: NDArray[np.float64] = x[:0]
+        self._y: NDArray[np.float64] = y[:0]
+        # the arrays `self._x` and `self._y` are views of, with room for more points;
+        # the first arrays given are used as they are, without copying
+        self._x_buffer: NDArray[np.float64] = self._x
+        self._y_buffer: NDArray[np.float64] = self._y
+        # for each level: the bin size, the first and the last `x` of the bins, the minima, and the maxima
+        self._levels: list[tuple[int, NDArray[np.float64], NDArray[np.float64],
+                                 NDArray[np.float64], NDArray[np.float64]]] = []
+        # for each level, the arrays the last four items of the tuple are views of, with room for more bins
+        self._buffers: list[list[NDArray[np.float64]]] = []
+        self.extend(x, y, like)
+
+    def extend(self, x: NDArray[np.float64], y: NDArray[np.float64], like: Optional[MinMaxPyramid] = None) -> None:
+        """
+        Append points to the curve, computing only the bins of the new points and the last partial bins
+        :param x: the abscissas of the new points, sorted, none less than the old ones
+        :param y: the ordinates of the new points
+        :param like: a pyramid of another curve with the same `x`, extended already, to take `x` and its decimation from
+        """
+        old_size: int = self._x.size
+        new_size: int = old_size + x.size
+        if like is not None and like._x.size != new_size:
+            like = None
+        if like is not None:
+            # the buffer of `like` is not to be written to by this pyramid
+            self._x_buffer = self._x = like._x
+        elif not old_size:
+            self._x_buffer = self._x = np.asarray(x, dtype=np.float64)
+        else:
+            self._x_buffer = self._put(self._x_buffer, old_size, x)
+            self._x = self._x_buffer[:new_size]
+        if not old_size:
+            self._y_buffer = self._y = np.asarray(y, dtype=np.float64)
+        else:
+            self._y_buffer = self._put(self._y_buffer, old_size, y)
+            self._y = self._y_buffer[:new_size]
+        x = self._x
+        y = self._y
+
+        level: int = 0
+        bin_size: int = 1
+        lower_mins: NDArray[np.float64] = y
+        lower_maxs: NDArray[np.float64] = y
+        changed_from: int = old_size  # the first item of the level below that has changed
+        while x.size // (bin_size * self.FACTOR) >= self.MIN_BINS_COUNT:
+            bin_size *= self.FACTOR
+            bins_count: int = -(-x.size // bin_size)
+            first_bin: int = changed_from // self.FACTOR if level < len(self._levels) else 0
+            if level == len(self._levels):
+                self._buffers.append([np.empty(0, dtype=np.float64) for _ in range(4)])
+            buffers: list[NDArray[np.float64]] = self._buffers[level]
+            x_starts: NDArray[np.float64]
+            x_ends: NDArray[np.float64]
+            if like is not None:
+                x_starts, x_ends = like._levels[level][1:3]
+            else:
+                buffers[0] = self._put(buffers[0], first_bin, x[first_bin * bin_size::bin_size])
+                buffers[1] = self._put(buffers[1], first_bin,
+                                       x[np.minimum(np.arange((first_bin + 1) * bin_size - 1,
+                                                              x.size + bin_size - 1, bin_size),
+                                                    x.size - 1)])
+                x_starts, x_ends = buffers[0][:bins_count], buffers[1][:bins_count]
+            buffers[2] = self._put(buffers[2], first_bin, self._reduce(np.fmin, lower_mins[first_bin * self.FACTOR:]))
+            buffers[3] = self._put(buffers[3], first_bin, self._reduce(np.fmax, lower_maxs[first_bin * self.FACTOR:]))
+            lower_mins, lower_maxs = buffers[2][:bins_count], buffers[3][:bins_count]
+            level_data: tuple[int, NDArray[np.float64], NDArray[np.float64], NDArray[np.float64],
+                              NDArray[np.float64]] = (bin_size, x_starts, x_ends, lower_mins, lower_maxs)
+            if level < len(self._levels):
+                self._levels[level] = level_data
+            else:
+                self._levels.append(level_data)
+            changed_from = first_bin
+            level += 1
+
+    @staticmethod
+    def _put(buffer: NDArray[np.float64], start: int, values: NDArray[np.float64]) -> NDArray[np.float64]:
+        """ Write `values` into `buffer` from `start`, growing it geometrically for the appending to be cheap """
+        stop: int = start + values.size
+        if stop > buffer.size:
+            new_buffer: NDArray[np.float64] = np.empty(max(stop, 2 * buffer.size), dtype=np.float64)
+            new_buffer[:start] = buffer[:start]
+            buffer = new_buffer
+        buffer[start:stop] = values
+        return buffer
+
+    @classmethod
+    def _reduce(cls, function: np.ufunc, values: NDArray[np.float64]) -> NDArray[np.float64]:
+        """ Apply `function` to every `FACTOR` consecutive values; NaN are ignored by `np.fmin` and `np.fmax` """
+        complete_bins_count: int = values.size // cls.FACTOR
+        reduced: NDArray[np.float64] = function.reduce(
+            values[:(complete_bins_count * cls.FACTOR)].reshape((complete_bins_count, cls.FACTOR)), axis=1)
+        if values.size % cls.FACTOR:
+            reduced = np.append(reduced, function.reduce(values[(complete_bins_count * cls.FACTOR):]))
+        return reduced
+
+    def data(self, x_min: float, x_max: float, max_points_count: int) -> tuple[NDArray[np.float64],
+                                                                               NDArray[np.float64]]:
+        """
+        Get the curve to draw for the range of `x` given
+        :param x_min: the left edge of the view
+        :param x_max: the right edge of the view
+        :param max_points_count: the number of points that's enough to draw the curve, like twice the view width
+        :return: `x` and `y` of the finest level that fits within `max_points_count` for the range given,
+                 with one point beyond the range on either side for the curve to reach the edges
+        """
+        first: int = max(0, int(np.searchsorted(self._x, x_min, side='left')) - 1)
+        last: int = min(self._x.size, int(np.searchsorted(self._x, x_max, side='right')) + 1)
+        if last - first <= max_points_count or not self._levels:
+            return self._x[first:last], self._y[first:last]
+        bin_size: int
+        x_starts: NDArray[np.float64]
+        x_ends: NDArray[np.float64]
+        mins: NDArray[np.float64]
+        maxs: NDArray[np.float64]
+        for bin_size, x_starts, x_ends, mins, maxs in self._levels:
+            if 2 * (last - first) // bin_size <= max_points_count:
+                break
+        first_bin: int = first // bin_size
+        last_bin: int = -(-last // bin_size)
+        x: NDArray[np.float64] = np.empty(2 * (last_bin - first_bin), dtype=np.float64)
+        y: NDArray[np.float64] = np.empty_like(x)
+        x[0::2] = x_starts[first_bin:last_bin]
+        x[1::2] = x_ends[first_bin:last_bin]
+        y[0::2] = mins[first_bin:last_bin]
+        y[1::2] = maxs[first_bin:last_bin]
+        return x, y
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+from gui._background_worker import BackgroundWorker, TaskCancelled
+
+__all__ = ['FileExporter']
+
+
+def _write(filename: Path, function: Callable[..., Any], *args: Any, progress: Callable[[int, int], Any],
+           **kwargs: Any) -> None:
+    try:
+        function(filename, *args, progress=progress, **kwargs)
+    except TaskCancelled:
+        try:
+            filename.unlink()  # it's incomplete
+        except OSError:
+            pass
+        raise
+
+
+class FileExporter(BackgroundWorker):
+    """ Write a file in a background thread, reporting the progress; the key of the results is the file name """
+
+    def export(self, filename: str | Path, function: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Call `function(filename, *args, progress=..., **kwargs)` in a background thread, cancelling any other export
+        :param filename: the name of the file to write
+        :param function: the function to write the file; it should call the `progress` function it gets
+                         with the number of rows written and the total number of rows every now and then
+        """
+        filename = Path(filename)
+        self.start(filename, _write, filename, function, *args, **kwargs)
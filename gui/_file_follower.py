@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Final, Optional
+
+from pyqtgraph.Qt import QtCore
+
+from log_parser import TailReader
+
+__all__ = ['FileFollower']
+
+
+class _ReadTask(QtCore.QRunnable):
+    def __init__(self, follower: FileFollower, reader: TailReader) -> None:
+        super().__init__()
+        self._follower: FileFollower = follower
+        self._reader: TailReader = reader
+
+    def run(self) -> None:
+        try:
+            data: Any = self._reader.read()
+        except Exception as ex:  # not to leave the follower busy forever
+            self._follower.readFinished.emit(self._reader, ex)
+        else:
+            self._follower.readFinished.emit(self._reader, data)
+
+
+class FileFollower(QtCore.QObject):
+    """ Watch a log file and read the records appended to it in a background thread """
+
+    # with the reader and the data, even if the following has stopped while reading, for the reader has moved on
+    dataRead: QtCore.Signal = QtCore.Signal(object, object, name='dataRead')
+    failed: QtCore.Signal = QtCore.Signal(object, name='failed')
+    readFinished: QtCore.Signal = QtCore.Signal(object, object, name='readFinished')  # emitted by the worker
+
+    DEBOUNCE_INTERVAL: Final[int] = 250  # ms
+    POLL_INTERVAL: Final[int] = 2000  # ms, for the changes the file system watcher misses, e.g. on network shares
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self._reader: Optional[TailReader] = None
+        self._busy: bool = False
+        self._pending: bool = False
+
+        self._watcher: QtCore.QFileSystemWatcher = QtCore.QFileSystemWatcher(self)
+        self._debounce_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_INTERVAL)
+        self._poll_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(self.POLL_INTERVAL)
+
+        self._watcher.fileChanged.connect(self.on_file_changed)
+        self._debounce_timer.timeout.connect(self.on_debounce_timer_timeout)
+        self._poll_timer.timeout.connect(self.check)
+        self.readFinished.connect(self.on_read_finished)
+
+    @property
+    def reader(self) -> Optional[TailReader]:
+        return self._reader
+
+    def is_active(self) -> bool:
+        return self._reader is not None
+
+    def start(self, reader: TailReader) -> None:
+        self.stop()
+        self._reader = reader
+        self._watcher.addPath(str(reader.filename))
+        self._poll_timer.start()
+        self.check()
+
+    def stop(self) -> None:
+        self._poll_timer.stop()
+        self._debounce_timer.stop()
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+        self._reader = None
+        self._pending = False
+
+    def check(self) -> None:
+        """ Schedule reading the new records, coalescing the bursts of requests """
+        if self._reader is not None:
+            self._debounce_timer.start()
+
+    def on_file_changed(self, path: str) -> None:
+        if self._reader is None:
+            return
+        if path not in self._watcher.files():  # the file has been replaced, so the watcher has lost it
+            self._watcher.addPath(path)
+        self.check()
+
+    def on_debounce_timer_timeout(self) -> None:
+        if self._reader is None:
+            return
+        if self._busy:
+            self._pending = True
+            return
+        self._busy = True
+        QtCore.QThreadPool.globalInstance().start(_ReadTask(self, self._reader))
+
+    def on_read_finished(self, reader: TailReader, result: Any) -> None:
+        self._busy = False
+        if not isinstance(result, Exception):
+            self.dataRead.emit(reader, result)
+        elif reader is self._reader:  # otherwise, stopped or restarted while reading
+            self.failed.emit(result)
+        if self._pending:
+            self._pending = False
+            self.check()
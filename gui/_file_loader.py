@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Optional, Sequence
+
+from pyqtgraph.Qt import QtCore
+
+from gui._background_worker import BackgroundWorker, _Task
+from log_parser import ChannelSummary, LogCache, TailReader
+
+__all__ = ['FileLoader']
+
+
+def _summarize(data: Any) -> list[ChannelSummary]:
+    channel: int
+    return [ChannelSummary.of(data[channel]) for channel in range(data.shape[0])]
+
+
+def _read(reader: TailReader, cache: Optional[LogCache], *,
+          progress: Callable[[int, int], Any]) -> tuple[Any, list[ChannelSummary]]:
+    """
+    Get the data and the statistics of its channels, taking the statistics from the cache if they are there,
+    for the data not to be scanned in the GUI thread
+    """
+    data: Any
+    summaries: Optional[list[ChannelSummary]] = None
+    if cache is None:
+        data = reader.read(progress)
+    else:
+        cached: Optional[tuple[list[str], Any]] = cache.load(reader.filename)
+        if cached is not None:
+            reader.skip(cached[1].shape[1])
+            data = cached[1]
+        else:
+            stat: os.stat_result = reader.filename.stat()
+            data = reader.read(progress)
+            cache.store(reader.filename, reader.titles, data, stat)
+        summaries = cache.load_summaries(reader.filename)
+    if summaries is None or len(summaries) != data.shape[0]:
+        summaries = _summarize(data)
+    return data, summaries
+
+
+class FileLoader(BackgroundWorker):
+    """
+    Read a log file in a background thread, reporting the progress
+
+    The key of the results is the reader, and the result is the data and the statistics of its channels,
+    see `ChannelSummary`.
+    A load cancelled after the reading gives `lateFinished`, for the reader has moved past the data.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self._reload_pending: bool = False  # whether to read again with the reader of `self._task` after it
+
+    def load(self, reader: TailReader, cache: Optional[LogCache] = None) -> None:
+        """
+        Read the records appended to the file since the previous read by `reader`, cancelling any other load
+
+        If `reader` is being read already, the reading is not cancelled, for the records read would be lost,
+        but it's done once more after the current one.
+        :param reader: the reader of the file
+        :param cache: the cache to take the data from or to put it into; use it only for a reader not used before
+        """
+        if self._task is not None and self._task.key is reader:
+            self._reload_pending = True
+            return
+        self.start(reader, _read, reader, cache)
+
+    def cancel(self) -> None:
+        self._reload_pending = False
+        super().cancel()
+
+    def on_task_finished(self, task: _Task, result: Any, ex: Optional[Exception]) -> None:
+        reload: bool = task is self._task and self._reload_pending
+        super().on_task_finished(task, result, ex)
+        if reload:
+            self._reload_pending = False
+            self.load(task.key)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ['Formatter', 'column_formatter',
+           'format_timestamps', 'format_kelvins', 'format_pressures', 'format_integers', 'format_numbers']
+
+Formatter = Callable[[NDArray[np.float64]], list[str]]
+
+
+def _utc_offset(timestamp: float) -> float:
+    return datetime.fromtimestamp(timestamp, timezone.utc).astimezone().utcoffset().total_seconds()
+
+
+def format_timestamps(values: NDArray[np.float64]) -> list[str]:
+    """ The same as `datetime.fromtimestamp(value).isoformat()` for every value, but an empty string for NaN """
+    finite: NDArray[np.bool] = np.isfinite(values)
+    finite_values: NDArray[np.float64] = values[finite]
+    if not finite_values.size:
+        return [''] * values.size
+    offset: float = _utc_offset(float(finite_values.min()))
+    strings: list[str]
+    if offset != _utc_offset(float(finite_values.max())):  # a daylight saving time switch
+        strings = [datetime.fromtimestamp(value).isoformat() for value in finite_values.tolist()]
+    else:
+        # split the seconds off before scaling for the microseconds to be rounded like `datetime.fromtimestamp` does
+        fractions: NDArray[np.float64]
+        seconds: NDArray[np.float64]
+        fractions, seconds = np.modf(finite_values)
+        microseconds: NDArray[np.int64] = ((seconds.astype(np.int64) + int(offset)) * 1_000_000
+                                           + np.round(fractions * 1e6).astype(np.int64))
+        # `isoformat` omits the zero fraction of a second
+        strings = [(s[:-7] if s.endswith('.000000') else s)
+                   for s in np.datetime_as_string(microseconds.astype('datetime64[us]'), unit='us').tolist()]
+    if finite_values.size == values.size:
+        return strings
+    result: list[str] = [''] * values.size
+    index: int
+    s: str
+    for index, s in zip(np.flatnonzero(finite).tolist(), strings):
+        result[index] = s
+    return result
+
+
+def format_kelvins(values: NDArray[np.float64]) -> list[str]:
+    return [('' if value != value else f'{value:.12f}'.rstrip('0').rstrip('.')) for value in values.tolist()]
+
+
+def format_pressures(values: NDArray[np.float64]) -> list[str]:
+    """ Format the values with three significant digits after the decimal point """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precisions: NDArray[np.float64] = 3.0 + np.trunc(-np.log10(np.abs(values)))
+    precisions = np.clip(np.nan_to_num(precisions, nan=0.0), 0, 20)
+    return [('' if value != value else f'{value:.{precision}f}'.rstrip('0').rstrip('.'))
+            for value, precision in zip(values.tolist(), precisions.astype(np.int_).tolist())]
+
+
+def format_integers(values: NDArray[np.float64]) -> list[str]:
+    return [('' if value != value else f'{value:.0f}') for value in values.tolist()]
+
+
+def format_numbers(values: NDArray[np.float64]) -> list[str]:
+    """ Format the integer values as integers and the rest with twelve digits after the decimal point at most """
+    if np.all(np.trunc(values) == values):  # no NaN, no fractions
+        return [f'{value:.0f}' for value in values.tolist()]
+    return [('' if value != value
+             else f'{value:.0f}' if value.is_integer()
+             else f'{value:.12f}'.rstrip('0').rstrip('.'))
+            for value in values.tolist()]
+
+
+def column_formatter(title: str) -> Formatter:
+    """ Choose the function to format the values of the channel by the channel title """
+    if title.endswith(('(s)', '(sec)', '(secs)')):
+        return format_timestamps
+    if title.endswith('(K)'):
+        return format_kelvins
+    if title.endswith('(Bar)'):
+        return format_pressures
+    return format_numbers
@@ -6,9 +6,11 @@ from typing import Any, Optional, cast
 
 import numpy as np
 import pyqtgraph as pg
+from numpy.typing import NDArray
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
 from gui._data_model import DataModel
+from gui._decimation import MinMaxPyramid
 from gui._settings import Settings
 
 __all__ = ['Plot']
@@ -22,6 +24,7 @@ class Plot(QtWidgets.QDialog):
         self.setObjectName('plot_dialog')
 
         self.settings: Settings = settings
+        self.data_model: DataModel = data_model
         self.setModal(True)
         self.setWindowTitle(self.tr('Plot'))
         if parent is not None:
@@ -35,6 +38,7 @@ class Plot(QtWidgets.QDialog):
 
         plot: pg.PlotWidget = pg.PlotWidget(self)
         canvas: pg.PlotItem = plot.getPlotItem()
+        self.canvas: pg.PlotItem = canvas
         canvas.setAxisItems({'bottom': pg.DateAxisItem()})
         layout.addWidget(plot)
         layout.setStretch(0, 0)
@@ -67,15 +71,19 @@ class Plot(QtWidgets.QDialog):
                                                                         rateLimit=10, slot=on_mouse_moved)
 
         header: str
-        column: np.ndarray
         visibility: bool
         self.lines: list[pg.PlotDataItem] = []
+        self.line_headers: list[str] = []
+        self.line_columns: list[Optional[int]] = []  # `None` for a line of a channel the data model lacks
+        self.rows_count: int = 0  # the number of points of the lines
+        self.pyramids: list[MinMaxPyramid] = []
         self.color_buttons: list[pg.ColorButton] = []
         visible_columns_count: int = 0
         visible_headers: list[str] = []
-        for header, column, visibility in zip(data_model.header, data_model.all_data, self.settings.check_items_values):
+        index: int
+        for index, (header, visibility) in enumerate(zip(data_model.header, self.settings.check_items_values)):
             if not (visibility and (self.settings.show_all_zero_columns
-                                    or not np.alltrue((column == 0.0) | np.isnan(column)))) \
+                                    or not data_model.statistics(index).all_zero)) \
                     or header.endswith(('(s)', '(sec)', '(secs)')):
                 continue
             else:
@@ -87,9 +95,9 @@ class Plot(QtWidgets.QDialog):
             self.lines[index].setPen(sender.color())
             self.settings.line_colors[visible_headers[index]] = sender.color()
 
-        for header, column, visibility in zip(data_model.header, data_model.all_data, self.settings.check_items_values):
+        for index, (header, visibility) in enumerate(zip(data_model.header, self.settings.check_items_values)):
             if not (visibility and (self.settings.show_all_zero_columns
-                                    or not np.alltrue((column == 0.0) | np.isnan(column)))) \
+                                    or not data_model.statistics(index).all_zero)) \
                     or header.endswith(('(s)', '(sec)', '(secs)')):
                 continue
             color: QtGui.QColor = self.settings.line_colors.get(header,
@@ -97,7 +105,8 @@ class Plot(QtWidgets.QDialog):
                                                                             hues=visible_columns_count))
             self.color_buttons.append(pg.ColorButton(controls_panel, color))
             controls_layout.addRow(header, self.color_buttons[-1])
-            self.lines.append(canvas.plot(np.column_stack((data_model.all_data[0], column)), name=header, pen=color))
+            self.lines.append(canvas.plot(name=header, pen=color))
+            self.line_headers.append(header)
             self.color_buttons[-1].sigColorChanged.connect(set_line_color)
 
         self.settings.beginGroup('plot')
@@ -107,6 +116,58 @@ class Plot(QtWidgets.QDialog):
             self.restoreGeometry(window_settings)
         self.settings.endGroup()
 
+        self.build_pyramids()
+        self._x_range_changed_signal_proxy: pg.SignalProxy = pg.SignalProxy(canvas.vb.sigXRangeChanged,
+                                                                             rateLimit=30, slot=self.update_lines)
+        self._resized_signal_proxy: pg.SignalProxy = pg.SignalProxy(canvas.vb.sigResized,
+                                                                     rateLimit=30, slot=self.update_lines)
+        data_model.dataAppended.connect(self.on_data_appended)
+        data_model.modelReset.connect(self.build_pyramids)
+
+    def update_lines(self, *_: Any) -> None:
+        """ Draw the decimation level of every line that suits the visible range and the width of the plot """
+        x_min: float
+        x_max: float
+        if self.canvas.vb.autoRangeEnabled()[0]:
+            # the whole lines are visible, and clipping them would make the auto-range shrink with them
+            x_min, x_max = -np.inf, np.inf
+        else:
+            x_min, x_max = self.canvas.vb.viewRange()[0]
+        max_points_count: int = 2 * max(1, int(self.canvas.vb.width()))
+        line: pg.PlotDataItem
+        pyramid: MinMaxPyramid
+        for line, pyramid in zip(self.lines, self.pyramids):
+            line.setData(*pyramid.data(x_min, x_max, max_points_count))
+
+    def build_pyramids(self) -> None:
+        """ Decimate the lines anew, for the data of the data model to have been replaced """
+        header: str
+        self.line_columns = [self.data_model.header.index(header) if header in self.data_model.header else None
+                             for header in self.line_headers]
+        self.rows_count = self.data_model.rowCount(available_count=True)
+        # the columns of several files are joined here once, for the pyramids to share `x`
+        x: NDArray[np.float64] = np.asarray(self.data_model.column(0)) if self.data_model.header else np.empty(0)
+        self.pyramids = []
+        index: Optional[int]
+        for index in self.line_columns:
+            self.pyramids.append(MinMaxPyramid(x, np.asarray(self.data_model.column(index))
+                                               if index is not None else np.full(x.size, np.nan),
+                                               like=self.pyramids[0] if self.pyramids else None))
+        self.update_lines()
+
+    def on_data_appended(self) -> None:
+        """ Decimate only the rows appended, for the whole columns might be chunks to join """
+        old_rows_count: int = self.rows_count
+        self.rows_count = self.data_model.rowCount(available_count=True)
+        x: NDArray[np.float64] = np.asarray(self.data_model.column(0)[old_rows_count:])
+        index: Optional[int]
+        pyramid: MinMaxPyramid
+        for index, pyramid in zip(self.line_columns, self.pyramids):
+            pyramid.extend(x, np.asarray(self.data_model.column(index)[old_rows_count:])
+                           if index is not None else np.full(x.size, np.nan),
+                           like=self.pyramids[0] if pyramid is not self.pyramids[0] else None)
+        self.update_lines()
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         self.settings.beginGroup('plot')
         self.settings.setValue('geometry', self.saveGeometry())
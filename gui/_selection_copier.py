@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Any, Callable, Final, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from gui._background_worker import BackgroundWorker
+from gui._formatters import Formatter
+
+__all__ = ['SelectionCopier']
+
+_BLOCK_SIZE: Final[int] = 1 << 14  # rows formatted at once
+
+
+def _stringify(rows: NDArray[np.intp], columns: list[NDArray[np.float64]], formatters: list[Formatter],
+               selections: list[Optional[NDArray[np.bool]]], separator: str, line_end: str, *,
+               progress: Callable[[int, int], Any]) -> tuple[str, str]:
+    """ Make the plain text and the HTML of the cells, see `SelectionCopier.copy` """
+    # the lines are joined by blocks not to keep a string object per line till the end
+    plain_blocks: list[str] = []
+    html_blocks: list[str] = ['<table>']
+    start: int
+    for start in range(0, rows.size, _BLOCK_SIZE):
+        block_rows: NDArray[np.intp] = rows[start:start + _BLOCK_SIZE]
+        strings: list[list[str]] = []
+        column: NDArray[np.float64]
+        formatter: Formatter
+        selection: Optional[NDArray[np.bool]]
+        for column, formatter, selection in zip(columns, formatters, selections):
+            strings.append(formatter(column[block_rows]))
+            if selection is not None:  # blank the cells not selected
+                index: int
+                for index in np.flatnonzero(~selection[start:start + _BLOCK_SIZE]).tolist():
+                    strings[-1][index] = ''
+        row_strings: tuple[str, ...]
+        plain_blocks.append(line_end.join([separator.join(row_strings) for row_strings in zip(*strings)]))
+        html_blocks.append(line_end.join([('<tr><td>' + ('</td>' + separator + '<td>').join(row_strings)
+                                           + '</td></tr>')
+                                          for row_strings in zip(*strings)]))
+        progress(min(start + _BLOCK_SIZE, rows.size), rows.size)
+    html_blocks.append('</table>')
+    return line_end.join(plain_blocks), line_end.join(html_blocks)
+
+
+class SelectionCopier(BackgroundWorker):
+    """
+    Make the plain text and the HTML of the table cells in a background thread, reporting the progress
+
+    The key of the results is the indices of the rows copied, and the result is the plain text and the HTML.
+    """
+
+    def copy(self, rows: NDArray[np.intp], columns: list[NDArray[np.float64]], formatters: list[Formatter],
+             selections: list[Optional[NDArray[np.bool]]], separator: str, line_end: str) -> None:
+        """
+        Start making the text of the cells, cancelling any other copying
+        :param rows: the indices of the rows to copy, sorted
+        :param columns: the columns to copy
+        :param formatters: the functions to format the values of the columns
+        :param selections: for every column, whether the cells of `rows` are selected, or None if all of them are;
+                           the cells not selected are left empty
+        :param separator: the text between the cells in a line of the plain text
+        :param line_end: the text between the lines
+        """
+        self.start(rows, _stringify, rows, columns, formatters, selections, separator, line_end)
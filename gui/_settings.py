@@ -76,6 +76,10 @@ class Settings(QtCore.QSettings):
                 self.tr('Show columns with all zeros'): ('show_all_zero_columns', ),
                 self.tr('Translation file:'): ('translation_path', ),
             },
+            self.tr('Loading'): {
+                self.tr('Cache decoded files'): ('use_cache', ),
+                self.tr('Show table rows in batches'): ('fetch_rows_in_batches', ),
+            },
             self.tr('Export'): {
                 self.tr('Line ending:'): (self.LINE_ENDS, self._LINE_ENDS, 'line_end'),
                 self.tr('CSV separator:'): (self.CSV_SEPARATORS, self._CSV_SEPARATORS, 'csv_separator'),
@@ -130,6 +134,32 @@ class Settings(QtCore.QSettings):
         self.setValue('showAllZeroColumns', new_value)
         self.endGroup()
 
+    @property
+    def use_cache(self) -> bool:
+        self.beginGroup('cache')
+        v: bool = bool(self.value('enabled', False, bool))
+        self.endGroup()
+        return v
+
+    @use_cache.setter
+    def use_cache(self, new_value: bool) -> None:
+        self.beginGroup('cache')
+        self.setValue('enabled', new_value)
+        self.endGroup()
+
+    @property
+    def fetch_rows_in_batches(self) -> bool:
+        self.beginGroup('table')
+        v: bool = bool(self.value('fetchRowsInBatches', False, bool))
+        self.endGroup()
+        return v
+
+    @fetch_rows_in_batches.setter
+    def fetch_rows_in_batches(self, new_value: bool) -> None:
+        self.beginGroup('table')
+        self.setValue('fetchRowsInBatches', new_value)
+        self.endGroup()
+
     @property
     def columns(self) -> tuple[list[str], list[bool]]:
         return self.check_items_names, self.check_items_values
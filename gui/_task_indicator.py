@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from typing import Optional
+
+from pyqtgraph.Qt import QtGui, QtWidgets
+
+from gui._background_worker import BackgroundWorker
+
+__all__ = ['TaskIndicator']
+
+
+class TaskIndicator(QtWidgets.QWidget):
+    """ A progress bar and a button to cancel the task of a `BackgroundWorker`, shown while the task runs """
+
+    def __init__(self, worker: BackgroundWorker, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.main_layout: QtWidgets.QHBoxLayout = QtWidgets.QHBoxLayout(self)
+        self.progress_bar: QtWidgets.QProgressBar = QtWidgets.QProgressBar(self)
+        self.button_cancel: QtWidgets.QToolButton = QtWidgets.QToolButton(self)
+
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setSpacing(0)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setMaximumWidth(160)
+        self.main_layout.addWidget(self.progress_bar)
+        self.button_cancel.setIcon(QtGui.QIcon.fromTheme('process-stop'))
+        self.button_cancel.setAutoRaise(True)
+        self.main_layout.addWidget(self.button_cancel)
+        self.hide()
+
+        worker.started.connect(self.on_started)
+        worker.progress.connect(self.on_progress)
+        worker.finished.connect(self.on_stopped)
+        worker.failed.connect(self.on_stopped)
+        worker.cancelled.connect(self.on_stopped)
+        self.button_cancel.clicked.connect(worker.cancel)
+
+    def on_started(self) -> None:
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(0)
+        self.show()
+
+    def on_progress(self, done: int, total: int) -> None:
+        if total <= 0:  # the amount of work is unknown
+            self.progress_bar.setRange(0, 0)  # a busy indicator
+            return
+        # the values are scaled for the file sizes not to overflow the progress bar range
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(int(self.progress_bar.maximum() * done / total))
+
+    def on_stopped(self, *_: object) -> None:
+        self.hide()
@@ -1,18 +1,25 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from datetime import datetime
+import functools
 from pathlib import Path
-from typing import Callable, Optional, cast
+from typing import Any, Callable, Optional, Sequence, cast
 
 import numpy as np
+from numpy.typing import NDArray
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
+from gui._background_worker import BackgroundWorker
 from gui._data_model import DataModel
+from gui._file_exporter import FileExporter
+from gui._file_follower import FileFollower
+from gui._file_loader import FileLoader
 from gui._plot import Plot
 from gui._preferences import Preferences
+from gui._selection_copier import SelectionCopier
 from gui._settings import Settings
-from log_parser import parse
+from gui._task_indicator import TaskIndicator
+from log_parser import ChannelSummary, ChunkedArray, LogCache, SessionReader, TailReader, write_csv, write_xlsx, writers
 
 
 def copy_to_clipboard(plain_text: str, rich_text: str = '',
@@ -45,8 +52,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.menu_plot: QtWidgets.QMenu = QtWidgets.QMenu(self.menu_bar)
         self.menu_about: QtWidgets.QMenu = QtWidgets.QMenu(self.menu_bar)
         self.action_open: QtGui.QAction = QtGui.QAction(self)
+        self.action_open_folder: QtGui.QAction = QtGui.QAction(self)
         self.action_export: QtGui.QAction = QtGui.QAction(self)
         self.action_reload: QtGui.QAction = QtGui.QAction(self)
+        self.action_follow: QtGui.QAction = QtGui.QAction(self)
+        self.action_cancel: QtGui.QAction = QtGui.QAction(self)
         self.action_preferences: QtGui.QAction = QtGui.QAction(self)
         self.action_quit: QtGui.QAction = QtGui.QAction(self)
         self.action_copy: QtGui.QAction = QtGui.QAction(self)
@@ -58,6 +68,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self.status_bar: QtWidgets.QStatusBar = QtWidgets.QStatusBar(self)
 
         self._opened_file_name: str = ''
+        self._opened_file_names: list[str] = []  # all the files shown as one
+        self._reader: Optional[TailReader | SessionReader] = None
+        self._follower: FileFollower = FileFollower(self)
+        self._loader: FileLoader = FileLoader(self)
+        self._exporter: FileExporter = FileExporter(self)
+        self._copier: SelectionCopier = SelectionCopier(self)
+        self._running_workers: list[BackgroundWorker] = []  # the latest started last, for Esc to cancel it
+        self.loading_indicator: TaskIndicator = TaskIndicator(self._loader, self.status_bar)
+        self.exporting_indicator: TaskIndicator = TaskIndicator(self._exporter, self.status_bar)
+        self.copying_indicator: TaskIndicator = TaskIndicator(self._copier, self.status_bar)
         self._exported_file_name: str = ''
         self.settings: Settings = Settings('SavSoft', 'VeriCold data log viewer', self)
         if application is not None and self.settings.translation_path is not None:
@@ -94,6 +114,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.table.setWordWrap(False)
         self.table.setObjectName('table')
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table_model.fetch_rows_in_batches = self.settings.fetch_rows_in_batches
         self.main_layout.addWidget(self.table, 0, 0, 1, 1)
         self.setCentralWidget(self.central_widget)
         self.menu_bar.setGeometry(QtCore.QRect(0, 0, 800, 29))
@@ -106,12 +127,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setMenuBar(self.menu_bar)
         self.status_bar.setObjectName('status_bar')
         self.setStatusBar(self.status_bar)
+        self.loading_indicator.setObjectName('loading_indicator')
+        self.status_bar.addPermanentWidget(self.loading_indicator)
+        self.exporting_indicator.setObjectName('exporting_indicator')
+        self.status_bar.addPermanentWidget(self.exporting_indicator)
+        self.copying_indicator.setObjectName('copying_indicator')
+        self.status_bar.addPermanentWidget(self.copying_indicator)
         self.action_open.setIcon(QtGui.QIcon.fromTheme('document-open'))
         self.action_open.setObjectName('action_open')
+        self.action_open_folder.setIcon(QtGui.QIcon.fromTheme('folder-open'))
+        self.action_open_folder.setObjectName('action_open_folder')
         self.action_export.setIcon(QtGui.QIcon.fromTheme('document-save-as'))
         self.action_export.setObjectName('action_export')
         self.action_reload.setIcon(QtGui.QIcon.fromTheme('view-refresh'))
         self.action_reload.setObjectName('action_reload')
+        self.action_follow.setIcon(QtGui.QIcon.fromTheme('media-playback-start'))
+        self.action_follow.setCheckable(True)
+        self.action_follow.setObjectName('action_follow')
+        self.action_cancel.setIcon(QtGui.QIcon.fromTheme('process-stop'))
+        self.action_cancel.setObjectName('action_cancel')
+        self.addAction(self.action_cancel)  # for the shortcut to work, for the action is in no menu
         self.action_preferences.setMenuRole(QtGui.QAction.MenuRole.PreferencesRole)
         self.action_preferences.setObjectName('action_preferences')
         self.action_quit.setIcon(QtGui.QIcon.fromTheme('application-exit'))
@@ -132,8 +167,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.action_about_qt.setMenuRole(QtGui.QAction.MenuRole.AboutQtRole)
         self.action_about_qt.setObjectName('action_about_qt')
         self.menu_file.addAction(self.action_open)
+        self.menu_file.addAction(self.action_open_folder)
         self.menu_file.addAction(self.action_export)
         self.menu_file.addAction(self.action_reload)
+        self.menu_file.addAction(self.action_follow)
         self.menu_file.addSeparator()
         self.menu_file.addAction(self.action_preferences)
         self.menu_file.addSeparator()
@@ -154,10 +191,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.menu_plot.setEnabled(False)
         self.action_export.setEnabled(False)
         self.action_reload.setEnabled(False)
+        self.action_follow.setEnabled(False)
+        self.action_cancel.setEnabled(False)
 
         self.action_open.setShortcut('Ctrl+O')
         self.action_export.setShortcuts(('Ctrl+S', 'Ctrl+E'))
         self.action_reload.setShortcuts(('Ctrl+R', 'F5'))
+        self.action_follow.setShortcut('Ctrl+L')
+        self.action_cancel.setShortcut('Esc')
         self.action_preferences.setShortcut('Ctrl+,')
         self.action_quit.setShortcuts(('Ctrl+Q', 'Ctrl+X'))
         self.action_copy.setShortcut('Ctrl+C')
@@ -166,8 +207,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.action_about.setShortcut('F1')
 
         self.action_open.triggered.connect(self.on_action_open_triggered)
+        self.action_open_folder.triggered.connect(self.on_action_open_folder_triggered)
         self.action_export.triggered.connect(self.on_action_export_triggered)
         self.action_reload.triggered.connect(self.on_action_reload_triggered)
+        self.action_follow.toggled.connect(self.on_action_follow_toggled)
+        self.action_cancel.triggered.connect(self.on_action_cancel_triggered)
         self.action_preferences.triggered.connect(self.on_action_preferences_triggered)
         self.action_quit.triggered.connect(self.on_action_quit_triggered)
         self.action_copy.triggered.connect(self.on_action_copy_triggered)
@@ -176,6 +220,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.action_show_plot.triggered.connect(self.on_action_show_plot_triggered)
         self.action_about.triggered.connect(self.on_action_about_triggered)
         self.action_about_qt.triggered.connect(self.on_action_about_qt_triggered)
+        self._follower.dataRead.connect(self.on_follower_data_read)
+        self._follower.failed.connect(self.on_follower_failed)
+        self._loader.started.connect(self.on_loader_started)
+        self._loader.finished.connect(self.on_loader_finished)
+        self._loader.lateFinished.connect(self.on_loader_late_finished)
+        self._loader.failed.connect(self.on_loader_failed)
+        self._loader.cancelled.connect(self.on_loader_cancelled)
+        self._exporter.started.connect(self.on_exporter_started)
+        self._exporter.finished.connect(self.on_exporter_finished)
+        self._exporter.failed.connect(self.on_exporter_failed)
+        self._exporter.cancelled.connect(self.on_exporter_cancelled)
+        self._copier.started.connect(self.on_copier_started)
+        self._copier.finished.connect(self.on_copier_finished)
+        self._copier.failed.connect(self.on_copier_failed)
+        self._copier.cancelled.connect(self.on_copier_cancelled)
 
         self.translate()
 
@@ -191,8 +250,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self.menu_plot.setTitle(_translate('main_window', 'Plot'))
         self.menu_about.setTitle(_translate('main_window', 'About'))
         self.action_open.setText(_translate('main_window', 'Open...'))
+        self.action_open_folder.setText(_translate('main_window', 'Open Folder...'))
         self.action_export.setText(_translate('main_window', 'Export...'))
         self.action_reload.setText(_translate('main_window', 'Reload'))
+        self.action_follow.setText(_translate('main_window', 'Follow'))
+        self.action_cancel.setText(_translate('main_window', 'Cancel'))
+        self.loading_indicator.setToolTip(_translate('main_window', 'Loading'))
+        self.loading_indicator.button_cancel.setToolTip(_translate('main_window', 'Cancel Loading'))
+        self.exporting_indicator.setToolTip(_translate('main_window', 'Exporting'))
+        self.exporting_indicator.button_cancel.setToolTip(_translate('main_window', 'Cancel Exporting'))
+        self.copying_indicator.setToolTip(_translate('main_window', 'Copying'))
+        self.copying_indicator.button_cancel.setToolTip(_translate('main_window', 'Cancel Copying'))
         self.action_preferences.setText(_translate('main_window', 'Preferences...'))
         self.action_quit.setText(_translate('main_window', 'Quit'))
         self.action_copy.setText(_translate('main_window', 'Copy'))
@@ -203,6 +271,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.action_about_qt.setText(_translate('main_window', 'About Qt'))
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._follower.stop()
+        self._loader.cancel()
+        self._exporter.cancel()
+        self._copier.cancel()
         self.save_settings()
         event.accept()
 
@@ -236,170 +308,205 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings.endGroup()
         self.settings.sync()
 
-    def stringify_selection_plain_text(self, whole_table: bool = False) -> str:
+    def copy_cells(self, rows: NDArray[np.intp], columns: list[int],
+                   selections: Optional[list[Optional[NDArray[np.bool]]]] = None) -> None:
         """
-        Convert selected cells to string for copying as plain text
-        :return: the plain text representation of the selected table lines
+        Start copying the cells as plain text and as HTML
+        :param rows: the indices of the rows to copy, sorted
+        :param columns: the indices of the columns to copy
+        :param selections: for every column, whether the cells of `rows` are selected, or None if all of them are;
+                           the cells not selected are copied empty
         """
-        text_matrix: list[list[str]]
-        if whole_table:
-            text_matrix = [[self.table_model.formatted_item(row, column)
-                            for column in range(self.table_model.columnCount())
-                            if self.settings.visible_columns[column]]
-                           for row in range(self.table_model.rowCount(available_count=True))]
-        else:
-            si: QtCore.QModelIndex
-            rows: list[int] = sorted(list(set(si.row() for si in self.table.selectedIndexes())))
-            cols: list[int] = sorted(list(set(si.column() for si in self.table.selectedIndexes())))
-            text_matrix = [['' for _ in range(len(cols))]
-                           for _ in range(len(rows))]
-            for si in self.table.selectedIndexes():
-                text_matrix[rows.index(si.row())][cols.index(si.column())] = self.table_model.data(si) or ''
-        row_texts: list[str]
-        text: list[str] = [self.settings.csv_separator.join(row_texts) for row_texts in text_matrix]
-        return self.settings.line_end.join(text)
-
-    def stringify_selection_html(self, whole_table: bool = False) -> str:
-        """
-        Convert selected cells to string for copying as rich text
-        :return: the rich text representation of the selected table lines
-        """
-        text_matrix: list[list[str]]
-        if whole_table:
-            text_matrix = [[('<td>' + self.table_model.formatted_item(row, column) + '</td>')
-                            for column in range(self.table_model.columnCount())
-                            if self.settings.visible_columns[column]]
-                           for row in range(self.table_model.rowCount(available_count=True))]
-        else:
-            si: QtCore.QModelIndex
-            rows: list[int] = sorted(list(set(si.row() for si in self.table.selectedIndexes())))
-            cols: list[int] = sorted(list(set(si.column() for si in self.table.selectedIndexes())))
-            text_matrix = [['' for _ in range(len(cols))]
-                           for _ in range(len(rows))]
-            for si in self.table.selectedIndexes():
-                text_matrix[rows.index(si.row())][cols.index(si.column())] = \
-                    '<td>' + (self.table_model.data(si) or '') + '</td>'
-        row_texts: list[str]
-        text: list[str] = [('<tr>' + self.settings.csv_separator.join(row_texts) + '</tr>')
-                           for row_texts in text_matrix]
-        text.insert(0, '<table>')
-        text.append('</table>')
-        return self.settings.line_end.join(text)
+        column: int
+        self._copier.copy(rows,
+                          [self.table_model.column(column) for column in columns],
+                          [self.table_model.formatter(column) for column in columns],
+                          selections if selections is not None else [None] * len(columns),
+                          self.settings.csv_separator, self.settings.line_end)
 
     def load_file(self, file_name: str) -> bool:
+        """
+        Start loading the file, or all the log files in the directory as one, in the background
+        :return: whether the loading has started
+        """
         if not file_name:
             return False
-        try:
-            titles, data = parse(file_name)
-        except (IOError, RuntimeError) as ex:
-            self.status_bar.showMessage(' '.join(repr(a) for a in ex.args))
+        if Path(file_name).is_dir():
+            return self.load_files(sorted(map(str, Path(file_name).glob('*.vcl'))))
+        return self.load_files([file_name])
+
+    def load_files(self, file_names: list[str]) -> bool:
+        """
+        Start loading the files as one in the background, see `SessionReader`
+        :return: whether the loading has started
+        """
+        if not file_names:
             return False
+        self._opened_file_names = file_names
+        if len(file_names) == 1:
+            self._loader.load(TailReader(file_names[0]), LogCache() if self.settings.use_cache else None)
         else:
-            self._opened_file_name = file_name
-            self.table_model.set_data(data, titles)
-            self.menu_view.clear()
-            self.settings.columns = self.table_model.header, [self.settings.is_visible(title)
-                                                              for title in self.table_model.header]
-            index: int
-            title: str
-            for index, title in enumerate(self.table_model.header):
-                action: QtGui.QAction = self.menu_view.addAction(title)
-                action.setCheckable(True)
-                if (self.settings.is_visible(title)
-                        and (self.settings.show_all_zero_columns
-                             or not np.alltrue((self.table_model.all_data[index] == 0.0)
-                                               | np.isnan(self.table_model.all_data[index])))):
-                    action.setChecked(True)
-                    self.table.showColumn(index)
-                else:
-                    action.setChecked(False)
-                    self.table.hideColumn(index)
-                action.triggered.connect(self.on_action_column_triggered)
-            self.menu_view.setEnabled(True)
-            self.menu_plot.setEnabled(True)
-            self.action_export.setEnabled(True)
-            self.action_reload.setEnabled(True)
+            self._loader.load(SessionReader(file_names))
+        return True
+
+    def on_worker_started(self, worker: BackgroundWorker) -> None:
+        if worker in self._running_workers:
+            self._running_workers.remove(worker)
+        self._running_workers.append(worker)
+        self.action_cancel.setEnabled(True)
+
+    def on_worker_stopped(self, worker: BackgroundWorker) -> None:
+        if worker in self._running_workers:
+            self._running_workers.remove(worker)
+        self.action_cancel.setEnabled(bool(self._running_workers))
+
+    def on_action_cancel_triggered(self) -> None:
+        """ Cancel the latest of the background tasks running, as they are shown with separate indicators """
+        if self._running_workers:
+            self._running_workers[-1].cancel()
+
+    def on_loader_started(self) -> None:
+        self.on_worker_started(self._loader)
+        self.status_bar.showMessage(self.tr('Loading...'))
+
+    def on_loader_stopped(self) -> None:
+        self.on_worker_stopped(self._loader)
+
+    def on_loader_cancelled(self) -> None:
+        self.on_loader_stopped()
+        self.status_bar.showMessage(self.tr('Cancelled'))
+
+    def on_loader_failed(self, reader: TailReader | SessionReader, ex: Exception) -> None:
+        self.on_loader_stopped()
+        if reader is self._reader and isinstance(ex, IOError):  # the file has been truncated or replaced
+            self.load_files(self._opened_file_names)
+        else:
+            self.status_bar.showMessage(' '.join(repr(a) for a in ex.args))
+
+    def on_loader_finished(self, reader: TailReader | SessionReader,
+                           result: tuple[np.ndarray | ChunkedArray, Sequence[ChannelSummary]]) -> None:
+        self.on_loader_stopped()
+        data: np.ndarray | ChunkedArray
+        summaries: Sequence[ChannelSummary]
+        data, summaries = result
+        if reader is self._reader:  # reloaded
+            self.table_model.append_data(data, summaries)
             self.status_bar.showMessage(self.tr('Ready'))
-            return True
+            return
+        self._opened_file_name = str(reader.filename)
+        self._reader = reader
+        if self.action_follow.isChecked():
+            self._follower.start(reader)
+        self.table_model.set_data(data, reader.titles, summaries)
+        self.menu_view.clear()
+        self.settings.columns = self.table_model.header, [self.settings.is_visible(title)
+                                                          for title in self.table_model.header]
+        index: int
+        title: str
+        for index, title in enumerate(self.table_model.header):
+            action: QtGui.QAction = self.menu_view.addAction(title)
+            action.setCheckable(True)
+            if (self.settings.is_visible(title)
+                    and (self.settings.show_all_zero_columns
+                         or not self.table_model.statistics(index).all_zero)):
+                action.setChecked(True)
+                self.table.showColumn(index)
+            else:
+                action.setChecked(False)
+                self.table.hideColumn(index)
+            action.triggered.connect(self.on_action_column_triggered)
+        self.menu_view.setEnabled(True)
+        self.menu_plot.setEnabled(True)
+        self.action_export.setEnabled(True)
+        self.action_reload.setEnabled(True)
+        self.action_follow.setEnabled(True)
+        self.setWindowTitle(f'{self._opened_file_name} — {getattr(self, "initial_window_title")}')
+        self.status_bar.showMessage(self.tr('Ready'))
+
+    def on_loader_late_finished(self, reader: TailReader | SessionReader,
+                                result: tuple[np.ndarray, Sequence[ChannelSummary]]) -> None:
+        if reader is self._reader:  # a reload cancelled after reading, and the reader won't give the data again
+            self.table_model.append_data(*result)
+
+    def on_exporter_started(self) -> None:
+        self.on_worker_started(self._exporter)
+        self.status_bar.showMessage(self.tr('Exporting...'))
+
+    def on_exporter_stopped(self) -> None:
+        self.on_worker_stopped(self._exporter)
+
+    def on_exporter_cancelled(self) -> None:
+        self.on_exporter_stopped()
+        self.status_bar.showMessage(self.tr('Cancelled'))
+
+    def on_exporter_failed(self, filename: Path, ex: Exception) -> None:
+        self.on_exporter_stopped()
+        self.status_bar.showMessage(' '.join(repr(a) for a in ex.args))
+
+    def on_exporter_finished(self, filename: Path, _: None) -> None:
+        self.on_exporter_stopped()
+        self._exported_file_name = str(filename)
+        self.status_bar.showMessage(self.tr('Saved to {0}').format(filename))
+
+    def save_columns(self, filename: str, writer: Callable[..., Any], **kwargs: Any) -> bool:
+        """
+        Start writing the visible columns into a file in the background
+        :param filename: the name of the file to write
+        :param writer: a function from `log_parser` to write the file, like `write_csv`
+        :param kwargs: the options for the writer
+        :return: whether the writing has started
+        """
+        visible_column_indices: list[int] = [index for index, title in enumerate(self.table_model.header)
+                                             if self.settings.is_visible(title)]
+        visible_column_names: list[str] = list(filter(self.settings.is_visible, self.table_model.header))
+        self._exporter.export(filename, writer, visible_column_names,
+                              [self.table_model.column(index) for index in visible_column_indices], **kwargs)
+        return True
 
     def save_csv(self, filename: str) -> bool:
-        visible_column_indices: np.ndarray = np.array([index for index, title in enumerate(self.table_model.header)
-                                                       if self.settings.is_visible(title)])
-        visible_column_names: list[str] = list(filter(self.settings.is_visible, self.table_model.header))
-        try:
-            np.savetxt(filename, self.table_model.all_data[visible_column_indices].T, fmt='%s',
-                       delimiter=self.settings.csv_separator, newline=self.settings.line_end,
-                       header=self.settings.csv_separator.join(visible_column_names))
-        except IOError as ex:
-            self.status_bar.showMessage(' '.join(ex.args))
-            return False
-        else:
-            self._exported_file_name = filename
-            self.status_bar.showMessage(self.tr('Saved to {0}').format(filename))
-            return True
+        return self.save_columns(filename, write_csv,
+                                 separator=self.settings.csv_separator, line_end=self.settings.line_end)
 
     def save_xlsx(self, filename: str) -> bool:
         try:
             import xlsxwriter
-            from xlsxwriter import Workbook
-            from xlsxwriter.format import Format
-            from xlsxwriter.worksheet import Worksheet
         except ImportError as ex:
             self.status_bar.showMessage(' '.join(repr(a) for a in ex.args))
             return False
 
-        visible_column_indices: list[int] = [index for index, title in enumerate(self.table_model.header)
-                                             if self.settings.is_visible(title)]
-        visible_column_names: list[str] = list(filter(self.settings.is_visible, self.table_model.header))
-        try:
-            workbook: Workbook = Workbook(filename,
-                                          {'default_date_format': 'dd.mm.yyyy hh:mm:ss',
-                                           'nan_inf_to_errors': True})
-            header_format: Format = workbook.add_format({'bold': True})
-            worksheet: Worksheet = workbook.add_worksheet(str(Path(self._opened_file_name).with_suffix('').name))
-            worksheet.freeze_panes(1, 0)  # freeze first row
-            col: int = 0
-            _col: int
-            row: int
-            for _col in range(self.table_model.columnCount()):
-                if _col not in visible_column_indices:
-                    continue
-                worksheet.write_string(0, col, visible_column_names[col], header_format)
-                if visible_column_names[col].endswith(('(s)', '(secs)')):
-                    for row in range(self.table_model.rowCount(available_count=True)):
-                        worksheet.write_datetime(row + 1, col, datetime.fromtimestamp(self.table_model.item(row, _col)))
-                else:
-                    for row in range(self.table_model.rowCount(available_count=True)):
-                        worksheet.write_number(row + 1, col, self.table_model.item(row, _col))
-                col += 1
-            workbook.close()
-        except IOError as ex:
-            self.status_bar.showMessage(' '.join(ex.args))
-            return False
-        else:
-            self._exported_file_name = filename
-            self.status_bar.showMessage(self.tr('Saved to {0}').format(filename))
-            return True
+        return self.save_columns(filename, write_xlsx,
+                                 sheet_name=str(Path(self._opened_file_name).with_suffix('').name))
 
     def on_action_open_triggered(self) -> None:
-        new_file_name: str
-        new_file_name, _ = QtWidgets.QFileDialog.getOpenFileName(
+        new_file_names: list[str]
+        new_file_names, _ = QtWidgets.QFileDialog.getOpenFileNames(
             self, self.tr('Open'),
             self._opened_file_name,
             f'{self.tr("VeriCold data logfile")} (*.vcl);;{self.tr("All Files")} (*.*)')
-        if self.load_file(new_file_name):
-            self.setWindowTitle(f'{new_file_name} — {getattr(self, "initial_window_title")}')
+        self.load_files(new_file_names)
+
+    def on_action_open_folder_triggered(self) -> None:
+        new_directory: str = QtWidgets.QFileDialog.getExistingDirectory(self, self.tr('Open Folder'),
+                                                                        str(Path(self._opened_file_name).parent))
+        self.load_file(new_directory)
 
     def on_action_export_triggered(self) -> None:
         supported_formats: dict[str, str] = {'.csv': f'{self.tr("Text with separators")} (*.csv)'}
         supported_formats_callbacks: dict[str, Callable[[str], bool]] = {'.csv': self.save_csv}
-        try:
-            import xlsxwriter
-        except ImportError:
-            pass
-        else:
+        available_writers: dict[str, Callable[..., None]] = writers()
+        if '.xlsx' in available_writers:
             supported_formats['.xlsx'] = f'{self.tr("Microsoft Excel")} (*.xlsx)'
             supported_formats_callbacks['.xlsx'] = self.save_xlsx
+        suffix: str
+        description: str
+        for suffix, description in {'.npz': self.tr('NumPy arrays'),
+                                    '.parquet': self.tr('Apache Parquet'),
+                                    '.feather': self.tr('Apache Arrow Feather'),
+                                    '.h5': self.tr('HDF5')}.items():
+            if suffix in available_writers:
+                supported_formats[suffix] = f'{description} (*{suffix})'
+                supported_formats_callbacks[suffix] = functools.partial(self.save_columns,
+                                                                        writer=available_writers[suffix])
         initial_filter: str = ''
         if self._exported_file_name:
             exported_file_name_ext: str = Path(self._exported_file_name).suffix
@@ -425,25 +532,51 @@ class MainWindow(QtWidgets.QMainWindow):
         i: int
         for i, a in enumerate(self.menu_view.actions()):
             if a.isChecked() and (self.settings.show_all_zero_columns
-                                  or not np.alltrue((self.table_model.all_data[i] == 0.0)
-                                                    | np.isnan(self.table_model.all_data[i]))):
+                                  or not self.table_model.statistics(i).all_zero):
                 self.table.showColumn(i)
             else:
                 self.table.hideColumn(i)
         self.settings.visible_columns = [a.isChecked() for a in self.menu_view.actions()]
 
     def on_action_reload_triggered(self) -> None:
-        try:
-            titles, data = parse(self._opened_file_name)
-        except (IOError, RuntimeError):
+        if self._reader is None:
+            return
+        if self._follower.is_active():
+            self._follower.check()
+            return
+        if not self.table_model.rowCount(available_count=True):
+            # there has been no data to tell the all-zero columns by
+            self.load_files(self._opened_file_names)
+            return
+        self._loader.load(self._reader)
+
+    def on_action_follow_toggled(self, checked: bool) -> None:
+        if checked and self._reader is not None:
+            self._follower.start(self._reader)
+        else:
+            self._follower.stop()
+
+    def on_follower_data_read(self, reader: TailReader | SessionReader, data: np.ndarray) -> None:
+        if reader is not self._reader or not np.size(data):
             return
+        if not self.table_model.rowCount(available_count=True):
+            # there has been no data to tell the all-zero columns by
+            self.load_files(self._opened_file_names)
         else:
-            self.table_model.set_data(data, titles)
+            self.table_model.append_data(data)
+
+    def on_follower_failed(self, ex: Exception) -> None:
+        if isinstance(ex, IOError):  # the file has been truncated or replaced
+            self.load_files(self._opened_file_names)
+        else:
+            self.status_bar.showMessage(' '.join(repr(a) for a in ex.args))
 
     def on_action_preferences_triggered(self) -> None:
         preferences_dialog: Preferences = Preferences(self.settings, self)
         preferences_dialog.exec()
 
+        self.table_model.fetch_rows_in_batches = self.settings.fetch_rows_in_batches
+
         title: str
         visibility: bool
         action: QtGui.QAction
@@ -454,8 +587,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 action.setChecked(visibility)
                 action.blockSignals(False)
             if visibility and (self.settings.show_all_zero_columns
-                               or not np.alltrue((self.table_model.all_data[column] == 0.0)
-                                                 | np.isnan(self.table_model.all_data[column]))):
+                               or not self.table_model.statistics(column).all_zero):
                 self.table.showColumn(column)
             else:
                 self.table.hideColumn(column)
@@ -464,12 +596,57 @@ class MainWindow(QtWidgets.QMainWindow):
         self.close()
 
     def on_action_copy_triggered(self) -> None:
-        copy_to_clipboard(self.stringify_selection_plain_text(),
-                          self.stringify_selection_html(), QtCore.Qt.TextFormat.RichText)
+        # the selection ranges are few even when the selected cells are many
+        selection_range: QtCore.QItemSelectionRange
+        selection_ranges: list[QtCore.QItemSelectionRange] = list(self.table.selectionModel().selection())
+        if not selection_ranges:
+            return
+        selected_rows: NDArray[np.bool] = np.zeros(self.table_model.rowCount(), dtype=np.bool_)
+        for selection_range in selection_ranges:
+            selected_rows[selection_range.top():selection_range.bottom() + 1] = True
+        rows: NDArray[np.intp] = np.flatnonzero(selected_rows)
+        columns: list[int] = sorted(set(column
+                                        for selection_range in selection_ranges
+                                        for column in range(selection_range.left(), selection_range.right() + 1)
+                                        if not self.table.isColumnHidden(column)))
+        selections: list[Optional[NDArray[np.bool]]] = []
+        column: int
+        for column in columns:
+            selected_rows[:] = False
+            for selection_range in selection_ranges:
+                if selection_range.left() <= column <= selection_range.right():
+                    selected_rows[selection_range.top():selection_range.bottom() + 1] = True
+            selections.append(None if len(selection_ranges) == 1 else selected_rows[rows])
+        self.copy_cells(rows, columns, selections)
 
     def on_action_copy_all_triggered(self) -> None:
-        copy_to_clipboard(self.stringify_selection_plain_text(whole_table=True),
-                          self.stringify_selection_html(whole_table=True), QtCore.Qt.TextFormat.RichText)
+        column: int
+        self.copy_cells(np.arange(self.table_model.rowCount(available_count=True)),
+                        [column for column in range(self.table_model.columnCount())
+                         if self.settings.visible_columns[column]])
+
+    def on_copier_started(self) -> None:
+        self.on_worker_started(self._copier)
+        self.status_bar.showMessage(self.tr('Copying...'))
+
+    def on_copier_stopped(self) -> None:
+        self.on_worker_stopped(self._copier)
+
+    def on_copier_cancelled(self) -> None:
+        self.on_copier_stopped()
+        self.status_bar.showMessage(self.tr('Cancelled'))
+
+    def on_copier_failed(self, rows: NDArray[np.intp], ex: Exception) -> None:
+        self.on_copier_stopped()
+        self.status_bar.showMessage(' '.join(repr(a) for a in ex.args))
+
+    def on_copier_finished(self, rows: NDArray[np.intp], texts: tuple[str, str]) -> None:
+        self.on_copier_stopped()
+        plain_text: str
+        html: str
+        plain_text, html = texts
+        copy_to_clipboard(plain_text, html, QtCore.Qt.TextFormat.RichText)
+        self.status_bar.showMessage(self.tr('Copied'))
 
     def on_action_select_all_triggered(self) -> None:
         self.table.selectAll()
@@ -477,6 +654,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_action_show_plot_triggered(self) -> None:
         plot: Plot = Plot(self.settings, self.table_model, self)
         plot.exec()
+        plot.deleteLater()
 
     def on_action_about_triggered(self) -> None:
         QtWidgets.QMessageBox.about(self,
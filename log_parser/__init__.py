@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from log_parser._async import aiter_chunks, aparse
+from log_parser._catalog import CatalogEntry, LogCatalog
+from log_parser._parser import TailReader, iter_chunks, parse
+
+__all__ = ['parse', 'iter_chunks', 'TailReader', 'aparse', 'aiter_chunks', 'LogCatalog', 'CatalogEntry']
+
+try:
+    from log_parser._cache import ChannelSummary, LogCache
+    from log_parser._export import (write_csv, write_feather, write_hdf5, write_npz, write_parquet, write_xlsx,
+                                    writers)
+    from log_parser._session import ChunkedArray, ChunkedColumn, SessionReader, parse_files
+    from log_parser._shared import SharedLog, parse_many
+except ImportError:  # NumPy is missing
+    pass
+else:
+    __all__ += ['LogCache', 'ChannelSummary',
+                'write_csv', 'write_xlsx', 'write_npz', 'write_parquet', 'write_feather', 'write_hdf5', 'writers',
+                'parse_files', 'SessionReader', 'ChunkedArray', 'ChunkedColumn',
+                'parse_many', 'SharedLog']
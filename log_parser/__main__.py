@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+""" Convert VeriCold log files into other formats without the GUI: `python -m log_parser convert --help` """
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+
+def _log_files(paths: Sequence[str], recursive: bool) -> list[Path]:
+    """ Expand the directories and the wildcards the shell has not expanded into the names of the log files """
+    files: list[Path] = []
+    path: str
+    for path in paths:
+        if Path(path).is_dir():
+            files.extend(sorted(Path(path).rglob('*.vcl') if recursive else Path(path).glob('*.vcl')))
+        elif glob.has_magic(path):
+            files.extend(sorted(map(Path, glob.glob(path, recursive=recursive))))
+        else:
+            files.append(Path(path))
+    return files
+
+
+def _output_filenames(files: Sequence[Path], output_dir: Optional[Path], suffix: str) -> list[Path]:
+    """
+    Name the converted files after the log files, next to them or in `output_dir`;
+    the log files of the same name from different directories keep their paths relative to their common directory
+    in `output_dir` not to overwrite one another
+    """
+    filename: Path
+    if output_dir is None:
+        return [filename.with_suffix(suffix) for filename in files]
+    names: list[str] = [filename.with_suffix(suffix).name for filename in files]
+    name: str
+    common_directory: Path = Path(os.path.commonpath([filename.resolve().parent for filename in files])) \
+        if files else Path()
+    return [output_dir / (filename.resolve().with_suffix(suffix).relative_to(common_directory)
+                          if names.count(name) > 1 else name)
+            for filename, name in zip(files, names)]
+
+
+def _column(column: str) -> str | int:
+    """ Take a number for a channel index and anything else for a channel title """
+    try:
+        return int(column)
+    except ValueError:
+        return column
+
+
+def _convert(filename: Path, output_filename: Path, writer: Callable[..., None],
+             columns: Optional[Sequence[str | int]], writer_options: dict[str, Any]) -> Path:
+    from log_parser import parse
+
+    titles: list[str]
+    data: Any
+    titles, data = parse(filename, columns=columns)
+    output_filename.parent.mkdir(parents=True, exist_ok=True)
+    writer(output_filename, titles, list(data), **writer_options)
+    return output_filename
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    try:
+        from log_parser import writers
+    except ImportError:
+        print('Ensure that NumPy is installed', file=sys.stderr)
+        return 1
+
+    available_writers: dict[str, Callable[..., None]] = writers()
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog=f'{Path(sys.executable).name} -m log_parser',
+                                                              description='VeriCold log file tools')
+    subparsers: argparse._SubParsersAction = parser.add_subparsers(dest='command', required=True)
+    convert_parser: argparse.ArgumentParser = subparsers.add_parser('convert', help='convert log files',
+                                                                    description='Convert log files into other formats')
+    convert_parser.add_argument('files', nargs='+', metavar='FILE',
+                                help='log files, wildcards, or directories to convert the `.vcl` files in')
+    convert_parser.add_argument('--to', required=True, choices=[suffix[1:] for suffix in available_writers],
+                                help='the format to convert into, one of those that have their libraries installed')
+    convert_parser.add_argument('--columns', nargs='+', type=_column, metavar='COLUMN',
+                                help='the titles or the indices of the channels to convert, all of them by default')
+    convert_parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                                help='the number of files to convert at once, the number of processors by default')
+    convert_parser.add_argument('--output-dir', '-o', type=Path, metavar='DIRECTORY',
+                                help='where to put the converted files, next to the log files by default')
+    convert_parser.add_argument('--recursive', '-r', action='store_true',
+                                help='look for the log files in the subdirectories too')
+    convert_parser.add_argument('--compression',
+                                help='the compression for the NPZ, Parquet, Feather, and HDF5 formats, '
+                                     'or "none" for no compression')
+    convert_parser.add_argument('--separator', default='\t',
+                                help='the text between the values for the CSV format, a tab by default')
+    arguments: argparse.Namespace = parser.parse_args(args)
+
+    if arguments.jobs < 1:
+        parser.error('the number of jobs must be positive')
+    suffix: str = '.' + arguments.to
+    writer_options: dict[str, Any] = {}
+    if suffix == '.csv':
+        writer_options['separator'] = arguments.separator
+    elif arguments.compression is not None:
+        if suffix == '.xlsx':
+            parser.error('XLSX files are always compressed')
+        writer_options['compression'] = None if arguments.compression.casefold() == 'none' else arguments.compression
+
+    filename: Path
+    # a file given twice, e.g., by a wildcard and by its name, is converted once
+    files: list[Path] = list({filename.resolve(): filename
+                              for filename in _log_files(arguments.files, arguments.recursive)}.values())
+    failures_count: int = 0
+    executor: Executor
+    with ProcessPoolExecutor(max_workers=min(arguments.jobs, len(files) or 1)) as executor:
+        futures: dict[Future[Path], Path] = {}
+        output_filename: Path
+        for filename, output_filename in zip(files, _output_filenames(files, arguments.output_dir, suffix)):
+            futures[executor.submit(_convert, filename, output_filename, available_writers[suffix],
+                                    arguments.columns, writer_options)] = filename
+        future: Future[Path]
+        for future in as_completed(futures):
+            try:
+                print(f'{futures[future]} -> {future.result()}')
+            except Exception as ex:  # whatever the parser or the writer raises, the other files are converted
+                failures_count += 1
+                print(f'{futures[future]}: {ex}', file=sys.stderr)
+    return 1 if failures_count else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import asyncio
+import functools
+import weakref
+from concurrent.futures import Executor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Optional, Sequence
+
+from log_parser._parser import _channel_indices, _decode_records, _read_record_size, _read_titles, parse
+
+__all__ = ['aparse', 'aiter_chunks']
+
+# the parsing under way, by the event loop and by the file and the arguments, for the same requests to share it
+_in_flight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[Any, ...], asyncio.Future[Any]]] = \
+    weakref.WeakKeyDictionary()
+
+
+async def aparse(filename: str | Path, *, mmap: bool = False,
+                 columns: Optional[Sequence[str | int]] = None,
+                 start: Optional[datetime | float] = None,
+                 stop: Optional[datetime | float] = None,
+                 executor: Optional[Executor] = None) -> tuple[list[str], Any]:
+    """
+    Do `parse` in an executor without blocking the event loop
+
+    The requests for the same file with the same arguments made while it's being parsed get the result of that parsing,
+    so they get the same arrays, which should not be changed then.
+    Cancelling a request doesn't stop the parsing as long as other requests wait for it.
+    :param filename: the name of the file
+    :param mmap: see `parse`; it requires NumPy
+    :param columns: see `parse`
+    :param start: see `parse`
+    :param stop: see `parse`
+    :param executor: the executor to parse the file in, the default one of the event loop if None
+    :return: the channel titles and the data, one row per channel
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    key: tuple[Any, ...] = (Path(filename).absolute(), mmap, tuple(columns) if columns is not None else None,
+                            start, stop)
+    in_flight: dict[tuple[Any, ...], asyncio.Future[Any]] = _in_flight.setdefault(loop, {})
+    future: Optional[asyncio.Future[Any]] = in_flight.get(key)
+    if future is None:
+        # `mmap` is not passed unless it's set, for `parse` has no such argument when NumPy is missing
+        future = loop.run_in_executor(executor, functools.partial(parse, filename, columns=columns,
+                                                                  start=start, stop=stop,
+                                                                  **({'mmap': True} if mmap else {})))
+        in_flight[key] = future
+        future.add_done_callback(lambda _: in_flight.pop(key, None))
+    return await asyncio.shield(future)
+
+
+def _read_header(filename: Path, columns: Optional[Sequence[str | int]]) -> tuple[list[str], list[int], int]:
+    """ Get the titles and the indices of the channels requested and the record size """
+    f_in: BinaryIO
+    with filename.open('rb') as f_in:
+        titles: list[str] = _read_titles(f_in)
+        channels: list[int] = _channel_indices(titles, columns)
+        record_size: int = _read_record_size(f_in)
+    channels = [channel for channel in channels if channel + 1 < record_size // 8]
+    return [titles[channel] for channel in channels], channels, record_size
+
+
+def _read_records(filename: Path, offset: int, size: int, record_size: int) -> bytes:
+    """ Read up to `size` bytes of complete records from `offset` """
+    f_in: BinaryIO
+    with filename.open('rb') as f_in:
+        f_in.seek(offset)
+        records: bytes = f_in.read(size)
+    return records[:(len(records) - len(records) % record_size)]  # the last record might be incomplete yet
+
+
+async def aiter_chunks(filename: str | Path, rows_per_chunk: int = 1 << 16, *,
+                       columns: Optional[Sequence[str | int]] = None,
+                       max_pending_chunks: int = 2,
+                       executor: Optional[Executor] = None) -> AsyncIterator[tuple[list[str], Any]]:
+    """
+    Do `iter_chunks` in an executor without blocking the event loop
+
+    The file is read ahead while the blocks are decoded and handled,
+    but no more than `max_pending_chunks` blocks of raw records are kept waiting,
+    so the memory used doesn't depend on how slow the blocks are taken.
+    :param filename: the name of the file
+    :param rows_per_chunk: the number of records in a block; the last block might be shorter
+    :param columns: the titles or the indices of the channels to read, all of them by default
+    :param max_pending_chunks: the number of blocks read but not decoded yet after which the reading waits
+    :param executor: the executor to read and to decode the blocks in, the default one of the event loop if None
+    :return: an asynchronous iterator over the channel titles and the data blocks, one row per channel
+    """
+    if rows_per_chunk <= 0:
+        raise ValueError('The number of rows per chunk must be positive')
+    if max_pending_chunks <= 0:
+        raise ValueError('The number of pending chunks must be positive')
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    path: Path = Path(filename)
+    titles: list[str]
+    channels: list[int]
+    record_size: int
+    titles, channels, record_size = await loop.run_in_executor(executor, _read_header, path, columns)
+    if not record_size:
+        return
+
+    # the raw records, then `b''` at the end of the file, or the exception raised while reading
+    pending_chunks: asyncio.Queue[bytes | Exception] = asyncio.Queue(max_pending_chunks)
+
+    async def read() -> None:
+        offset: int = 0x3000
+        try:
+            while True:
+                # the file is opened anew every time, for a read can't be stopped, and it might outlive this task
+                records: bytes = await loop.run_in_executor(executor, _read_records,
+                                                            path, offset, rows_per_chunk * record_size, record_size)
+                await pending_chunks.put(records)  # it waits here while the queue is full
+                if not records:
+                    return
+                offset += len(records)
+        except Exception as ex:
+            await pending_chunks.put(ex)
+
+    reader: asyncio.Task[None] = asyncio.create_task(read())
+    try:
+        records_read: int = 0
+        while True:
+            chunk: bytes | Exception = await pending_chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                break
+            yield titles, await loop.run_in_executor(executor, _decode_records,
+                                                     chunk, record_size, channels, records_read)
+            records_read += len(chunk) // record_size
+    finally:
+        reader.cancel()
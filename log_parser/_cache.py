@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Final, NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from log_parser._parser import parse
+from log_parser._session import ChunkedColumn
+
+__all__ = ['ChannelSummary', 'LogCache']
+
+
+def _default_directory() -> Path:
+    if sys.platform == 'win32' and 'LOCALAPPDATA' in os.environ:
+        return Path(os.environ['LOCALAPPDATA']) / 'VeriCold_log_parser' / 'cache'
+    if sys.platform == 'darwin':
+        return Path.home() / 'Library' / 'Caches' / 'VeriCold_log_parser'
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'VeriCold_log_parser'
+
+
+class ChannelSummary(NamedTuple):
+    """ The statistics of a channel kept along with the data by `LogCache` for a cache hit not to scan the data """
+
+    count: int
+    nan_count: int
+    nonzero_count: int  # NaN excluded
+    min: float  # NaN if there are no numbers in the channel
+    max: float
+    sum: float  # of the numbers
+    first_index: int  # of the first number in the channel, -1 if there are no numbers
+    last_index: int  # of the last number in the channel, -1 if there are no numbers
+
+    @property
+    def all_zeros(self) -> bool:
+        """ Whether the channel is all zeros, without NaN """
+        return not self.nonzero_count and not self.nan_count
+
+    @classmethod
+    def of(cls, values: NDArray[np.float64] | ChunkedColumn) -> ChannelSummary:
+        """ Compute the statistics of the channel values; the chunks of a `ChunkedColumn` are summarized one by one """
+        if isinstance(values, ChunkedColumn):
+            summary: ChannelSummary = cls.of(np.empty(0))
+            chunk: NDArray[np.float64]
+            for chunk in values.chunks:
+                summary = summary.merged(cls.of(chunk))
+            return summary
+        is_nan: NDArray[np.bool] = np.isnan(values)
+        nan_count: int = int(np.count_nonzero(is_nan))
+        if nan_count == values.size:
+            return cls(count=values.size, nan_count=nan_count, nonzero_count=0,
+                       min=np.nan, max=np.nan, sum=0.0, first_index=-1, last_index=-1)
+        # `np.count_nonzero` counts NaN, for NaN is not equal to zero
+        nonzero_count: int = int(np.count_nonzero(values)) - nan_count
+        # `np.argmin` finds the first `False`, and there is one, for not every value is NaN
+        return cls(count=values.size, nan_count=nan_count, nonzero_count=nonzero_count,
+                   min=float(np.fmin.reduce(values)), max=float(np.fmax.reduce(values)), sum=float(np.nansum(values)),
+                   first_index=int(np.argmin(is_nan)), last_index=values.size - 1 - int(np.argmin(is_nan[::-1])))
+
+    def merged(self, other: ChannelSummary) -> ChannelSummary:
+        """ Get the statistics of the channel made of the values of `self` followed by the values of `other` """
+        return ChannelSummary(count=self.count + other.count,
+                              nan_count=self.nan_count + other.nan_count,
+                              nonzero_count=self.nonzero_count + other.nonzero_count,
+                              min=float(np.fmin(self.min, other.min)), max=float(np.fmax(self.max, other.max)),
+                              sum=self.sum + other.sum,
+                              first_index=(self.first_index if self.first_index >= 0
+                                           else other.first_index + self.count if other.first_index >= 0 else -1),
+                              last_index=(other.last_index + self.count if other.last_index >= 0
+                                          else self.last_index))
+
+
+class LogCache:
+    """
+    A directory of decoded log files for re-opening them without parsing
+
+    Every entry is a pair of files: the data as an `.npy` file, one row per channel, to be memory-mapped,
+    and a `.json` file with the titles, the statistics of the channels, see `ChannelSummary`,
+    and the path, the size, and the modification time of the log file.
+    An entry gets stale as soon as the log file size or modification time changes.
+    The modification time of the `.json` file is the time of the last use of the entry,
+    and the least recently used entries are removed when the total size of the cache exceeds the limit.
+    """
+
+    DEFAULT_MAX_SIZE: Final[int] = 4 << 30
+
+    def __init__(self, directory: Optional[str | Path] = None, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._directory: Path = Path(directory) if directory is not None else _default_directory()
+        self.max_size: int = max_size
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def _entry_path(self, filename: Path) -> Path:
+        return self._directory / hashlib.sha256(str(filename.resolve()).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _key(filename: Path, stat: os.stat_result) -> dict[str, Any]:
+        return {'path': str(filename.resolve()), 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+    def _load_metadata(self, filename: Path) -> Optional[dict[str, Any]]:
+        """ Get the contents of the `.json` file of the entry, or None if the entry is missing or stale """
+        with self._entry_path(filename).with_suffix('.json').open('rt') as f_in:
+            metadata: dict[str, Any] = json.load(f_in)
+        if metadata.get('key') != self._key(filename, filename.stat()):
+            return None
+        return metadata
+
+    def load(self, filename: str | Path) -> Optional[tuple[list[str], NDArray[np.float64]]]:
+        """
+        Get the decoded log file from the cache
+        :param filename: the name of the log file
+        :return: the channel titles and the read-only memory-mapped data, or None if the entry is missing or stale
+        """
+        filename = Path(filename)
+        entry_path: Path = self._entry_path(filename)
+        try:
+            metadata: Optional[dict[str, Any]] = self._load_metadata(filename)
+            if metadata is None:
+                return None
+            data: NDArray[np.float64] = np.load(entry_path.with_suffix('.npy'), mmap_mode='r')
+            os.utime(entry_path.with_suffix('.json'))  # mark the entry as recently used
+        except (OSError, ValueError):
+            return None
+        return list(metadata['titles']), data
+
+    def load_summaries(self, filename: str | Path) -> Optional[list[ChannelSummary]]:
+        """
+        Get the statistics of the channels of the decoded log file from the cache
+        :param filename: the name of the log file
+        :return: the statistics of every channel, or None if the entry is missing, stale, or made without them
+        """
+        try:
+            metadata: Optional[dict[str, Any]] = self._load_metadata(Path(filename))
+            if metadata is None or 'summaries' not in metadata:
+                return None
+            summary: list[Any]
+            return [ChannelSummary(*summary) for summary in metadata['summaries']]
+        except (OSError, TypeError, ValueError):
+            return None
+
+    def store(self, filename: str | Path, titles: list[str], data: NDArray[np.float64],
+              stat: Optional[os.stat_result] = None) -> bool:
+        """
+        Put the decoded log file into the cache
+        :param filename: the name of the log file
+        :param titles: the channel titles
+        :param data: the data, one row per channel
+        :param stat: the status of the log file taken before reading it;
+                     if the file has changed since, the data is not cached
+        :return: whether the data has been cached
+        """
+        filename = Path(filename)
+        entry_path: Path = self._entry_path(filename)
+        # write to temporary files first for a concurrent reader never to see a partly written entry
+        data_path: Path = entry_path.with_suffix('.npy')
+        metadata_path: Path = entry_path.with_suffix('.json')
+        temp_data_path: Path = data_path.with_name(f'{data_path.name}.{os.getpid()}.tmp')
+        temp_metadata_path: Path = metadata_path.with_name(f'{metadata_path.name}.{os.getpid()}.tmp')
+        try:
+            if stat is None:
+                stat = filename.stat()
+            elif self._key(filename, stat) != self._key(filename, filename.stat()):
+                return False
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # the channels are copied one by one, for the data might be a view not to be made contiguous at once,
+            # and each is summarized while it's at hand
+            data_file: np.memmap = np.lib.format.open_memmap(temp_data_path, mode='w+', dtype=np.float64,
+                                                             shape=np.shape(data))
+            summaries: list[ChannelSummary] = []
+            index: int
+            for index in range(data_file.shape[0]):
+                data_file[index] = data[index]
+                summaries.append(ChannelSummary.of(data_file[index]))
+            data_file.flush()
+            del data_file
+            with temp_metadata_path.open('wt') as f_out:
+                json.dump({'key': self._key(filename, stat), 'titles': titles, 'summaries': summaries}, f_out)
+            os.replace(temp_data_path, data_path)
+            os.replace(temp_metadata_path, metadata_path)
+        except OSError:
+            # not to leave the partly written files behind, say, when the disk is full
+            temp_path: Path
+            for temp_path in (temp_data_path, temp_metadata_path):
+                try:
+                    temp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+            return False
+        self.evict(keep=entry_path)
+        return True
+
+    def parse(self, filename: str | Path) -> tuple[list[str], NDArray[np.float64]]:
+        """ Get the decoded log file from the cache, parsing and caching it if needed """
+        cached: Optional[tuple[list[str], NDArray[np.float64]]] = self.load(filename)
+        if cached is not None:
+            return cached
+        stat: os.stat_result = Path(filename).stat()
+        titles: list[str]
+        data: NDArray[np.float64]
+        titles, data = parse(filename)
+        self.store(filename, titles, data, stat)
+        return titles, data
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """ Remove the least recently used entries until the cache fits the size limit """
+        entries: list[tuple[int, int, Path]] = []  # last use, size, path without the suffix
+        total_size: int = 0
+        metadata_path: Path
+        for metadata_path in self._directory.glob('*.json'):
+            try:
+                entry_size: int = (metadata_path.stat().st_size
+                                   + metadata_path.with_suffix('.npy').stat().st_size)
+                entries.append((metadata_path.stat().st_mtime_ns, entry_size, metadata_path.with_suffix('')))
+            except OSError:
+                continue
+            total_size += entry_size
+        entries.sort()
+        last_use: int
+        entry_path: Path
+        for last_use, entry_size, entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            if entry_path == keep:
+                continue
+            try:
+                # the data first: the entries are found by their `.json` files, so a `.npy` file left alone is lost
+                entry_path.with_suffix('.npy').unlink()
+                entry_path.with_suffix('.json').unlink()
+            except OSError:
+                continue
+            total_size -= entry_size
+
+    def clear(self) -> None:
+        path: Path
+        for path in [*self._directory.glob('*.json'), *self._directory.glob('*.npy')]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
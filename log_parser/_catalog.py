@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+import sqlite3
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Iterable, NamedTuple, Optional, Sequence
+
+from log_parser._parser import _read_record_size, _read_titles, _time_channel
+
+__all__ = ['CatalogEntry', 'LogCatalog']
+
+_SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    records_count INTEGER NOT NULL,
+    record_size INTEGER NOT NULL,
+    first_timestamp REAL,
+    last_timestamp REAL
+);
+CREATE INDEX IF NOT EXISTS files_time_range ON files (first_timestamp, last_timestamp);
+CREATE TABLE IF NOT EXISTS channels (
+    path TEXT NOT NULL REFERENCES files (path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (path, position)
+);
+CREATE INDEX IF NOT EXISTS channels_title ON channels (title);
+'''
+
+
+class CatalogEntry(NamedTuple):
+    """ What `LogCatalog` knows about a log file """
+
+    path: Path
+    size: int
+    mtime_ns: int
+    titles: list[str]
+    records_count: int
+    record_size: int  # in bytes, including the size prefix; 0 if there are no records
+    first_timestamp: Optional[float]  # None if there are no records or no timestamp channel
+    last_timestamp: Optional[float]
+
+
+def _moment(moment: datetime | float) -> float:
+    return moment.timestamp() if isinstance(moment, datetime) else float(moment)
+
+
+def _read_entry(filename: Path, stat: os.stat_result) -> CatalogEntry:
+    """ Describe a log file reading only its header and the timestamps of its first and last records """
+    f_in: BinaryIO
+    with filename.open('rb') as f_in:
+        titles: list[str] = _read_titles(f_in)
+        record_size: int = _read_record_size(f_in)
+        records_count: int = (stat.st_size - 0x3000) // record_size if record_size else 0
+        first_timestamp: Optional[float] = None
+        last_timestamp: Optional[float] = None
+        time_channel: Optional[int] = _time_channel(titles)
+        if records_count and time_channel is not None and (time_channel + 2) * 8 <= record_size:
+            f_in.seek(0x3000 + (time_channel + 1) * 8)
+            first_timestamp = struct.unpack('<d', f_in.read(8))[0]
+            f_in.seek(0x3000 + (records_count - 1) * record_size + (time_channel + 1) * 8)
+            last_timestamp = struct.unpack('<d', f_in.read(8))[0]
+    return CatalogEntry(path=filename, size=stat.st_size, mtime_ns=stat.st_mtime_ns, titles=titles,
+                        records_count=records_count, record_size=record_size,
+                        first_timestamp=first_timestamp, last_timestamp=last_timestamp)
+
+
+class LogCatalog:
+    """
+    An SQLite database of the log files in some directories for finding the files without opening them
+
+    For every file, it stores the path, the size, the modification time, the channel titles, the number of records,
+    the record size, and the first and the last timestamps.
+    `update` re-reads only the headers of the files whose size or modification time have changed.
+    """
+
+    def __init__(self, filename: str | Path) -> None:
+        """ :param filename: the name of the database file, created if missing """
+        self._filename: Path = Path(filename)
+        self._connection: sqlite3.Connection = sqlite3.connect(self._filename)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> LogCatalog:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @property
+    def filename(self) -> Path:
+        return self._filename
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _store(self, entry: CatalogEntry) -> None:
+        self._connection.execute('DELETE FROM files WHERE path = ?', (str(entry.path),))  # with its channels
+        self._connection.execute('INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                 (str(entry.path), entry.size, entry.mtime_ns, entry.records_count, entry.record_size,
+                                  entry.first_timestamp, entry.last_timestamp))
+        position: int
+        title: str
+        self._connection.executemany('INSERT INTO channels VALUES (?, ?, ?)',
+                                     [(str(entry.path), position, title)
+                                      for position, title in enumerate(entry.titles)])
+
+    def update(self, directory: str | Path, recursive: bool = True) -> int:
+        """
+        Catalog the `.vcl` files in the directory, forgetting the ones deleted from it
+        :param directory: the directory to look for the log files in
+        :param recursive: whether to look into the subdirectories too
+        :return: the number of files added or updated
+        """
+        directory = Path(directory).resolve()
+        path: Path
+        paths: list[Path] = sorted(directory.rglob('*.vcl') if recursive else directory.glob('*.vcl'))
+        known: dict[str, tuple[int, int]] = {
+            row[0]: (row[1], row[2])
+            for row in self._connection.execute('SELECT path, size, mtime_ns FROM files')
+            if (Path(row[0]).is_relative_to(directory) if recursive else Path(row[0]).parent == directory)
+        }
+        updated_count: int = 0
+        with self._connection:
+            for path in paths:
+                try:
+                    stat: os.stat_result = path.stat()
+                    if known.pop(str(path), None) == (stat.st_size, stat.st_mtime_ns):
+                        continue
+                    self._store(_read_entry(path, stat))
+                except (OSError, RuntimeError, ValueError, struct.error):  # the file is gone or is not a log file
+                    self._connection.execute('DELETE FROM files WHERE path = ?', (str(path),))
+                else:
+                    updated_count += 1
+            # the files left have been deleted
+            self._connection.executemany('DELETE FROM files WHERE path = ?', [(path,) for path in known])
+        return updated_count
+
+    def _entries(self, condition: str = '', parameters: Sequence[object] = ()) -> list[CatalogEntry]:
+        rows: list[tuple[str, int, int, int, int, Optional[float], Optional[float]]] = self._connection.execute(
+            'SELECT path, size, mtime_ns, records_count, record_size, first_timestamp, last_timestamp FROM files '
+            + condition + ' ORDER BY first_timestamp, path', parameters).fetchall()
+        row: tuple[str, int, int, int, int, Optional[float], Optional[float]]
+        return [CatalogEntry(path=Path(row[0]), size=row[1], mtime_ns=row[2],
+                             titles=[title for title, in self._connection.execute(
+                                 'SELECT title FROM channels WHERE path = ? ORDER BY position', (row[0],))],
+                             records_count=row[3], record_size=row[4],
+                             first_timestamp=row[5], last_timestamp=row[6])
+                for row in rows]
+
+    def entry(self, filename: str | Path) -> Optional[CatalogEntry]:
+        """ Get what is known about the file, or None if it's not in the catalog """
+        entries: list[CatalogEntry] = self._entries('WHERE path = ?', (str(Path(filename).resolve()),))
+        return entries[0] if entries else None
+
+    def entries(self) -> list[CatalogEntry]:
+        """ Get all the files in the catalog, the earliest first """
+        return self._entries()
+
+    def find(self, *, start: Optional[datetime | float] = None, stop: Optional[datetime | float] = None,
+             channels: Iterable[str] = ()) -> list[CatalogEntry]:
+        """
+        Find the log files that have records within a time range and that have all the channels given
+        :param start: the earliest moment of interest, as a `datetime` or a UNIX timestamp
+        :param stop: the moment before which the records are of interest;
+                     when `start` or `stop` is given, the files without timestamps are not found
+        :param channels: the titles of the channels that the files must have
+        :return: the files found, the earliest first
+        """
+        conditions: list[str] = []
+        parameters: list[object] = []
+        if start is not None:
+            conditions.append('last_timestamp >= ?')
+            parameters.append(_moment(start))
+        if stop is not None:
+            conditions.append('first_timestamp < ?')
+            parameters.append(_moment(stop))
+        title: str
+        for title in channels:
+            conditions.append('path IN (SELECT path FROM channels WHERE title = ?)')
+            parameters.append(title)
+        return self._entries(('WHERE ' + ' AND '.join(conditions)) if conditions else '', parameters)
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import importlib.util
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Final, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+__all__ = ['write_csv', 'write_xlsx', 'write_npz', 'write_parquet', 'write_feather', 'write_hdf5', 'writers']
+
+_EXPORT_BLOCK_SIZE: Final[int] = 1 << 14  # rows
+_WRITE_BUFFER_SIZE: Final[int] = 1 << 22  # bytes
+_EXCEL_MAX_ROWS_COUNT: Final[int] = 1 << 20  # per sheet, including the header
+_EXCEL_MAX_SHEET_NAME_LENGTH: Final[int] = 31
+_EXCEL_UNIX_EPOCH: Final[float] = 25569.0  # 1970-01-01 as the number of days since 1899-12-30
+_COLUMNAR_BLOCK_SIZE: Final[int] = 1 << 20  # rows per row group of Parquet, per record batch of Feather, per HDF5 write
+
+
+def _is_timestamp_title(title: str) -> bool:
+    return title.endswith(('(s)', '(sec)', '(secs)'))
+
+
+def _utc_offset(timestamp: float) -> float:
+    return datetime.fromtimestamp(timestamp, timezone.utc).astimezone().utcoffset().total_seconds()
+
+
+def _excel_dates(timestamps: NDArray[np.float64]) -> NDArray[np.float64]:
+    """ Convert Unix timestamps into the Excel serial dates of the local time, NaN staying NaN """
+    finite_timestamps: NDArray[np.float64] = timestamps[np.isfinite(timestamps)]
+    offsets: float | NDArray[np.float64] = 0.0
+    if finite_timestamps.size:
+        offsets = _utc_offset(float(finite_timestamps.min()))
+        if offsets != _utc_offset(float(finite_timestamps.max())):  # a daylight saving time switch
+            timestamp: float
+            offsets = np.array([(_utc_offset(timestamp) if timestamp == timestamp else 0.0)
+                                for timestamp in timestamps.tolist()])
+    return (timestamps + offsets) / 86400.0 + _EXCEL_UNIX_EPOCH
+
+
+def _datetimes(timestamps: NDArray[np.float64]) -> NDArray[np.datetime64]:
+    """ Convert Unix timestamps into UTC date and time with microsecond resolution, NaN becoming NaT """
+    return np.round(timestamps * 1e6).astype('datetime64[us]')
+
+
+def _format_column(values: NDArray[np.float64]) -> list[str]:
+    """
+    Get the shortest text that reads back as the same float for every value, like `repr` and `str(np.float64)` do
+
+    Every distinct value is formatted once, for a channel tends to repeat its values, like zeros or a heater setting.
+    The values are told apart by their bits for `-0.0` not to be taken for `0.0`.
+    """
+    unique_bits: NDArray[np.int64]
+    inverse: NDArray[np.intp]
+    unique_bits, inverse = np.unique(values.view(np.int64), return_inverse=True)
+    if 2 * unique_bits.size > values.size:  # too few repetitions to pay off
+        return list(map(repr, values.tolist()))
+    return np.array(list(map(repr, unique_bits.view(np.float64).tolist())), dtype=object)[inverse].tolist()
+
+
+def write_csv(filename: str | Path, titles: Sequence[str], columns: Sequence[NDArray[np.float64]], *,
+              separator: str = '\t', line_end: str = '\n',
+              progress: Optional[Callable[[int, int], Any]] = None) -> None:
+    """
+    Write the data as text, a line per row, the titles commented out in the first line, like `np.savetxt` does
+    :param filename: the name of the file to write
+    :param titles: the column titles
+    :param columns: the columns of the same length
+    :param separator: the text between the values in a line
+    :param line_end: the text after every line
+    :param progress: a function to call with the number of rows written and the total number of rows after every block
+    """
+    rows_count: int = columns[0].size if columns else 0
+    # the line ends are written as is
+    with open(filename, 'wt', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f_out:
+        f_out.write('# ' + separator.join(titles) + line_end)
+        start: int
+        for start in range(0, rows_count, _EXPORT_BLOCK_SIZE):
+            column: NDArray[np.float64]
+            strings: list[list[str]] = [_format_column(np.ascontiguousarray(column[start:start + _EXPORT_BLOCK_SIZE],
+                                                                            dtype=np.float64))
+                                        for column in columns]
+            f_out.write(line_end.join(map(separator.join, zip(*strings))) + line_end)
+            if progress is not None:
+                progress(min(start + _EXPORT_BLOCK_SIZE, rows_count), rows_count)
+
+
+def write_xlsx(filename: str | Path, titles: Sequence[str], columns: Sequence[NDArray[np.float64]], *,
+               sheet_name: Optional[str] = None,
+               progress: Optional[Callable[[int, int], Any]] = None) -> None:
+    """
+    Write the data into a Microsoft Excel workbook, a row at a time, not to keep the whole sheet in memory
+
+    The timestamp channels are written as dates.
+    A sheet holds 1048575 rows at most, so the rest of the rows go to the next sheets.
+    :param filename: the name of the file to write
+    :param titles: the column titles
+    :param columns: the columns of the same length
+    :param sheet_name: the name of the first sheet; the next ones get the sheet number appended
+    :param progress: a function to call with the number of rows written and the total number of rows after every block
+    """
+    from xlsxwriter import Workbook
+    from xlsxwriter.exceptions import FileCreateError
+    from xlsxwriter.format import Format
+    from xlsxwriter.worksheet import Worksheet
+
+    rows_count: int = columns[0].size if columns else 0
+    rows_per_sheet: int = _EXCEL_MAX_ROWS_COUNT - 1
+    title: str
+    is_timestamp: list[bool] = [_is_timestamp_title(title) for title in titles]
+    try:
+        with Workbook(filename, {'constant_memory': True, 'nan_inf_to_errors': True}) as workbook:
+            header_format: Format = workbook.add_format({'bold': True})
+            date_format: Format = workbook.add_format({'num_format': 'dd.mm.yyyy hh:mm:ss'})
+            formats: list[Optional[Format]] = [(date_format if t else None) for t in is_timestamp]
+            sheet_start: int
+            for sheet_start in range(0, max(rows_count, 1), rows_per_sheet):
+                sheet_number: int = sheet_start // rows_per_sheet + 1
+                worksheet: Worksheet
+                if sheet_name is None:
+                    worksheet = workbook.add_worksheet()
+                elif sheet_number == 1:
+                    worksheet = workbook.add_worksheet(sheet_name[:_EXCEL_MAX_SHEET_NAME_LENGTH])
+                else:
+                    suffix: str = f' ({sheet_number})'
+                    worksheet = workbook.add_worksheet(
+                        sheet_name[:_EXCEL_MAX_SHEET_NAME_LENGTH - len(suffix)] + suffix)
+                worksheet.freeze_panes(1, 0)  # freeze first row
+                column_index: int
+                for column_index, title in enumerate(titles):
+                    worksheet.write_string(0, column_index, title, header_format)
+                # `constant_memory` mode requires the cells to be written row by row
+                write_number: Callable[..., int] = worksheet.write_number
+                sheet_stop: int = min(sheet_start + rows_per_sheet, rows_count)
+                start: int
+                for start in range(sheet_start, sheet_stop, _EXPORT_BLOCK_SIZE):
+                    stop: int = min(start + _EXPORT_BLOCK_SIZE, sheet_stop)
+                    column: NDArray[np.float64]
+                    block: list[list[float]] = np.column_stack([(_excel_dates(column[start:stop]) if t
+                                                                 else column[start:stop])
+                                                                for column, t in zip(columns, is_timestamp)]).tolist()
+                    row_index: int
+                    row: list[float]
+                    value: float
+                    for row_index, row in enumerate(block, start=start - sheet_start + 1):
+                        for column_index, value in enumerate(row):
+                            write_number(row_index, column_index, value, formats[column_index])
+                    if progress is not None:
+                        progress(stop, rows_count)
+    except FileCreateError as ex:
+        raise IOError(*ex.args) from ex
+
+
+def write_npz(filename: str | Path, titles: Sequence[str], columns: Sequence[NDArray[np.float64]], *,
+              compression: Optional[str] = 'deflate',
+              progress: Optional[Callable[[int, int], Any]] = None) -> None:
+    """
+    Write the data into a NumPy `.npz` file, an array per column named after the column title
+
+    The timestamp channels are written as `datetime64[us]` arrays of UTC time.
+    The file can be read with `np.load`.
+    :param filename: the name of the file to write
+    :param titles: the column titles
+    :param columns: the columns of the same length
+    :param compression: 'deflate' or None
+    :param progress: a function to call with the number of rows written and the total number of rows after every column
+    """
+    if compression not in ('deflate', None):
+        raise ValueError(f'Unsupported compression: {compression}')
+    rows_count: int = columns[0].size if columns else 0
+    with zipfile.ZipFile(filename, 'w', allowZip64=True,
+                         compression=zipfile.ZIP_DEFLATED if compression else zipfile.ZIP_STORED) as f_out:
+        index: int
+        title: str
+        column: NDArray[np.float64]
+        for index, (title, column) in enumerate(zip(titles, columns)):
+            column = np.asarray(column)  # join the chunks of a `ChunkedColumn`
+            with f_out.open(title + '.npy', 'w', force_zip64=True) as f_column:
+                np.lib.format.write_array(f_column, _datetimes(column) if _is_timestamp_title(title) else column,
+                                          allow_pickle=False)
+            if progress is not None and rows_count:  # like the other writers, no progress for no rows
+                progress(rows_count * (index + 1) // len(columns), rows_count)
+
+
+def _arrow_table(titles: Sequence[str], columns: Sequence[NDArray[np.float64]]) -> Any:
+    import pyarrow as pa
+
+    title: str
+    column: NDArray[np.float64]
+    return pa.table({title: (pa.array(_datetimes(column), type=pa.timestamp('us', tz='UTC'), mask=np.isnan(column))
+                             if _is_timestamp_title(title) else pa.array(column))
+                     for title, column in zip(titles, map(np.asarray, columns))})
+
+
+def write_parquet(filename: str | Path, titles: Sequence[str], columns: Sequence[NDArray[np.float64]], *,
+                  compression: Optional[str] = 'zstd',
+                  progress: Optional[Callable[[int, int], Any]] = None) -> None:
+    """
+    Write the data into an Apache Parquet file; requires `pyarrow`
+
+    The timestamp channels are written as timestamps of UTC time.
+    :param filename: the name of the file to write
+    :param titles: the column titles
+    :param columns: the columns of the same length
+    :param compression: the compression codec, like 'zstd', 'snappy', 'gzip', or None
+    :param progress: a function to call with the number of rows written and the total number of rows after every block
+    """
+    import pyarrow.parquet as pq
+
+    table: Any = _arrow_table(titles, columns)
+    with pq.ParquetWriter(filename, table.schema, compression=compression or 'none') as writer:
+        start: int
+        for start in range(0, table.num_rows, _COLUMNAR_BLOCK_SIZE):
+            writer.write_table(table.slice(start, _COLUMNAR_BLOCK_SIZE))
+            if progress is not None:
+                progress(min(start + _COLUMNAR_BLOCK_SIZE, table.num_rows), table.num_rows)
+
+
+def write_feather(filename: str | Path, titles: Sequence[str], columns: Sequence[NDArray[np.float64]], *,
+                  compression: Optional[str] = 'zstd',
+                  progress: Optional[Callable[[int, int], Any]] = None) -> None:
+    """
+    Write the data into a Feather file, which is an Apache Arrow IPC file; requires `pyarrow`
+
+    The timestamp channels are written as timestamps of UTC time.
+    :param filename: the name of the file to write
+    :param titles: the column titles
+    :param columns: the columns of the same length
+    :param compression: 'zstd', 'lz4', or None
+    :param progress: a function to call with the number of rows written and the total number of rows after every block
+    """
+    import pyarrow as pa
+
+    table: Any = _arrow_table(titles, columns)
+    with pa.ipc.new_file(str(filename), table.schema,
+                         options=pa.ipc.IpcWriteOptions(compression=compression)) as writer:
+        start: int
+        for start in range(0, table.num_rows, _COLUMNAR_BLOCK_SIZE):
+            writer.write_table(table.slice(start, _COLUMNAR_BLOCK_SIZE))
+            if progress is not None:
+                progress(min(start + _COLUMNAR_BLOCK_SIZE, table.num_rows), table.num_rows)
+
+
+def write_hdf5(filename: str | Path, titles: Sequence[str], columns: Sequence[NDArray[np.float64]], *,
+               compression: Optional[str] = 'gzip',
+               progress: Optional[Callable[[int, int], Any]] = None) -> None:
+    """
+    Write the data into an HDF5 file, a dataset per column named after the column title; requires `h5py`
+
+    HDF5 has no type for date and time, so the timestamp channels are written as they are,
+    with the `units` attribute set to 'seconds since 1970-01-01 00:00:00 UTC' as the CF conventions suggest.
+    :param filename: the name of the file to write
+    :param titles: the column titles
+    :param columns: the columns of the same length
+    :param compression: 'gzip', 'lzf', or None
+    :param progress: a function to call with the number of rows written and the total number of rows after every block
+    """
+    import h5py
+
+    rows_count: int = columns[0].size if columns else 0
+    with h5py.File(filename, 'w') as f_out:
+        title: str
+        column: NDArray[np.float64]
+        datasets: list[Any] = []
+        if not rows_count:  # an empty dataset can't be chunked, and so compressed
+            compression = None
+        for title, column in zip(titles, columns):
+            # a slash would make a group of the title
+            datasets.append(f_out.create_dataset(title.replace('/', '\u2215'), shape=(rows_count,), dtype=np.float64,
+                                                 chunks=(min(rows_count, _COLUMNAR_BLOCK_SIZE >> 4),) if compression
+                                                 else None,
+                                                 compression=compression, shuffle=compression is not None))
+            datasets[-1].attrs['title'] = title
+            if _is_timestamp_title(title):
+                datasets[-1].attrs['units'] = 'seconds since 1970-01-01 00:00:00 UTC'
+        start: int
+        for start in range(0, rows_count, _COLUMNAR_BLOCK_SIZE):
+            dataset: Any
+            for dataset, column in zip(datasets, columns):
+                dataset[start:start + _COLUMNAR_BLOCK_SIZE] = column[start:start + _COLUMNAR_BLOCK_SIZE]
+            if progress is not None:
+                progress(min(start + _COLUMNAR_BLOCK_SIZE, rows_count), rows_count)
+
+
+def writers() -> dict[str, Callable[..., None]]:
+    """ Get the functions to write the data, by the file name suffix, for the formats whose libraries are installed """
+    available_writers: dict[str, Callable[..., None]] = {'.csv': write_csv, '.npz': write_npz}
+    if importlib.util.find_spec('xlsxwriter') is not None:
+        available_writers['.xlsx'] = write_xlsx
+    if importlib.util.find_spec('pyarrow') is not None:
+        available_writers['.parquet'] = write_parquet
+        available_writers['.feather'] = write_feather
+    if importlib.util.find_spec('h5py') is not None:
+        available_writers['.h5'] = write_hdf5
+    return available_writers
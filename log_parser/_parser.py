@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import math
+import os
+import struct
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Final, Iterator, Optional, Sequence
+
+_MAX_CHANNELS_COUNT: Final[int] = 52
+_READ_CHUNK_SIZE: Final[int] = 1 << 24
+
+__all__ = ['parse', 'iter_chunks', 'TailReader']
+
+
+def _read_titles(file_handle: BinaryIO) -> list[str]:
+    file_handle.seek(0x1800 + 32)
+    titles: list[str] = [file_handle.read(32).strip(b'\0').decode('ascii')
+                         for _ in range(_MAX_CHANNELS_COUNT - 1)]
+    return list(filter(None, titles))
+
+
+def _read_record_size(file_handle: BinaryIO) -> int:
+    """ Get the size of the records in bytes, including the size prefix, or 0 if there are no records yet """
+    file_handle.seek(0x3000)
+    record_size_data: bytes = file_handle.read(8)
+    if len(record_size_data) < 8:
+        return 0
+    record_size_value: float = struct.unpack('<d', record_size_data)[0]
+    if not math.isfinite(record_size_value):
+        raise RuntimeError('Inconsistent data: some records are faulty')
+    record_size: int = int(round(record_size_value / 8)) * 8
+    if record_size <= 0:
+        raise RuntimeError('Inconsistent data: some records are faulty')
+    return record_size
+
+
+def _channel_indices(titles: list[str], columns: Optional[Sequence[str | int]]) -> list[int]:
+    """ Get the indices of the channels given by their titles or indices, or of all the channels """
+    if columns is None:
+        return list(range(len(titles)))
+    indices: list[int] = []
+    column: str | int
+    for column in columns:
+        if isinstance(column, str):
+            if column not in titles:
+                raise KeyError(f'No channel titled {column!r}')
+            indices.append(titles.index(column))
+        else:
+            if not -len(titles) <= column < len(titles):
+                raise IndexError(f'No channel #{column}')
+            indices.append(column % len(titles))
+    return indices
+
+
+def _time_channel(titles: Sequence[str]) -> Optional[int]:
+    """ Get the index of the timestamp channel, or None if there is none """
+    title: str
+    return next((index for index, title in enumerate(titles) if title.endswith(('(s)', '(sec)', '(secs)'))), None)
+
+
+def _records_range(file_handle: BinaryIO, titles: list[str], record_size: int, records_count: int,
+                   start: Optional[datetime | float], stop: Optional[datetime | float]) -> tuple[int, int]:
+    """
+    Find the records within the time range with a binary search right in the file
+    :return: the index of the first record in the range and the index of the record after the last one in it
+    """
+    time_channel: Optional[int] = _time_channel(titles)
+    if time_channel is None or (time_channel + 2) * 8 > record_size:
+        raise ValueError('No timestamp channel found')
+
+    def timestamp(index: int) -> float:
+        file_handle.seek(0x3000 + index * record_size + (time_channel + 1) * 8)
+        return struct.unpack('<d', file_handle.read(8))[0]
+
+    def bisect(moment: datetime | float) -> int:
+        """ Find the first record not earlier than `moment` """
+        value: float = moment.timestamp() if isinstance(moment, datetime) else float(moment)
+        low: int = 0
+        high: int = records_count
+        while low < high:
+            middle: int = (low + high) // 2
+            if timestamp(middle) < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    first_record: int = bisect(start) if start is not None else 0
+    last_record: int = bisect(stop) if stop is not None else records_count
+    return first_record, max(first_record, last_record)
+
+
+try:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    def _find_faulty_records(data: NDArray[np.float64], data_item_size: int) -> NDArray[np.intp]:
+        """
+        Check the size prefix of every record in one pass
+        :param data: the data section of a log file as a flat array
+        :param data_item_size: the expected record size, in items, including the size prefix
+        :return: the indices of the records whose size prefix differs from the expected one
+        """
+        record_sizes: NDArray[np.float64] = data[::data_item_size]
+        # the exact comparison makes no temporary arrays of floats and almost always suffices
+        suspicious_records: NDArray[np.intp] = np.flatnonzero(record_sizes != data_item_size * data.itemsize)
+        # noinspection PyTypeChecker
+        return suspicious_records[np.round(record_sizes[suspicious_records] / data.itemsize) != data_item_size]
+
+    def _select_channels(data: NDArray[np.float64], data_item_size: int, channels: Sequence[int],
+                         copy: bool = True) -> NDArray[np.float64]:
+        """
+        Take the channels from the data section
+        :param data: the data section of a log file as a flat array of complete records
+        :param data_item_size: the record size, in items, including the size prefix
+        :param channels: the indices of the channels to take
+        :param copy: whether to copy the consecutive channels; the scattered ones are always copied
+        :return: the data of the channels requested, one row per channel
+        """
+        records: NDArray[np.float64] = data.reshape((data_item_size, -1), order='F')
+        channels = [channel for channel in channels if channel + 1 < data_item_size]
+        if not channels or channels == list(range(channels[0], channels[-1] + 1)):
+            selected_channels: NDArray[np.float64] = records[(channels[0] + 1 if channels else 1):
+                                                             (channels[-1] + 2 if channels else 1)]
+            return selected_channels.astype(np.float64, order='C') if copy else selected_channels
+        # only the channels requested are materialised here
+        return records[[channel + 1 for channel in channels]].astype(np.float64, order='C', copy=False)
+
+    def _decode_records(records: bytes | bytearray, record_size: int, channels: Sequence[int],
+                        first_record_index: int = 0, copy: bool = True) -> NDArray[np.float64]:
+        # noinspection PyTypeChecker
+        dt: np.dtype = np.dtype(np.float64).newbyteorder('<')
+        data: NDArray[np.float64] = np.frombuffer(records, dtype=dt)
+        data_item_size: int = record_size // dt.itemsize
+        faulty_records: NDArray[np.intp] = _find_faulty_records(data, data_item_size)
+        if faulty_records.size:
+            raise RuntimeError('Inconsistent data: some records are faulty', faulty_records + first_record_index)
+        return _select_channels(data, data_item_size, channels, copy=copy)
+
+    def parse(filename: str | Path | BinaryIO, *, mmap: bool = False,
+              columns: Optional[Sequence[str | int]] = None,
+              start: Optional[datetime | float] = None,
+              stop: Optional[datetime | float] = None) -> tuple[list[str], NDArray[np.float64]]:
+        """
+        Read the channel titles and the data from a VeriCold log file
+        :param filename: the name of the file or an opened binary file
+        :param mmap: map the file into memory instead of reading it;
+                     the data returned is then a read-only view of the file, not a copy,
+                     unless the columns requested are not consecutive
+        :param columns: the titles or the indices of the channels to read, all of them by default;
+                        the file is then mapped into memory, and only the channels requested are copied
+        :param start: the earliest moment of the records to read, as a `datetime` or a UNIX timestamp
+        :param stop: the moment before which the records are read;
+                     the records for the time range are found with a binary search on the timestamps in the file,
+                     and only they are read
+        :return: the channel titles and the data, one row per channel
+        """
+        def _parse(file_handle: BinaryIO) -> tuple[list[str], NDArray[np.float64]]:
+            titles: list[str] = _read_titles(file_handle)
+            channels: list[int] = _channel_indices(titles, columns)
+            record_size: int = _read_record_size(file_handle)
+            if not record_size:
+                return [], np.empty(0)
+            file_handle.seek(0, os.SEEK_END)
+            first_record: int = 0
+            last_record: int = (file_handle.tell() - 0x3000) // record_size  # the last record might be incomplete
+            if start is not None or stop is not None:
+                first_record, last_record = _records_range(file_handle, titles, record_size, last_record,
+                                                           start, stop)
+            # noinspection PyTypeChecker
+            dt: np.dtype = np.dtype(np.float64).newbyteorder('<')
+            data_item_size: int = record_size // dt.itemsize
+            data_size: int = (last_record - first_record) * data_item_size
+            data: NDArray[np.float64]
+            if (mmap or columns is not None) and data_size > 0:
+                data = np.memmap(file_handle, dtype=dt, mode='r',
+                                 offset=0x3000 + first_record * record_size, shape=(data_size,))
+                if not mmap:  # the map is only a way to read the channels requested
+                    data = data.view(np.ndarray)
+            else:
+                file_handle.seek(0x3000 + first_record * record_size)
+                raw_data: bytes = file_handle.read(data_size * dt.itemsize)
+                data = np.frombuffer(raw_data, dtype=dt, count=len(raw_data) // record_size * data_item_size)
+            faulty_records: NDArray[np.intp] = _find_faulty_records(data, data_item_size)
+            if faulty_records.size:
+                raise RuntimeError('Inconsistent data: some records are faulty', faulty_records + first_record)
+            channels = [channel for channel in channels if channel + 1 < data_item_size]
+            return [titles[channel] for channel in channels], _select_channels(data, data_item_size, channels,
+                                                                               copy=not mmap)
+
+        if isinstance(filename, BinaryIO):
+            return _parse(filename)
+        f_in: BinaryIO
+        with (filename.open('rb') if isinstance(filename, Path) else open(filename, 'rb')) as f_in:
+            return _parse(f_in)
+
+except ImportError:
+    import array
+    import sys
+
+    def _split_channels(data: array.array, data_item_size: int, channels: Sequence[int],
+                        first_record_index: int = 0) -> list[array.array]:
+        if sys.byteorder != 'little':
+            data.byteswap()
+        record_sizes: array.array = data[::data_item_size]
+        # the exact comparison is done in C and almost always suffices
+        if record_sizes.count(float(data_item_size * data.itemsize)) != len(record_sizes):
+            faulty_records: list[int] = [index + first_record_index for index, record_size in enumerate(record_sizes)
+                                         if int(round(record_size / data.itemsize)) != data_item_size]
+            if faulty_records:
+                raise RuntimeError('Inconsistent data: some records are faulty', faulty_records)
+        return [data[(channel + 1)::data_item_size] for channel in channels if channel + 1 < data_item_size]
+
+    def _decode_records(records: bytes | bytearray, record_size: int, channels: Sequence[int],
+                        first_record_index: int = 0, copy: bool = True) -> list[array.array]:
+        data: array.array = array.array('d')
+        data.frombytes(records)
+        return _split_channels(data, record_size // data.itemsize, channels, first_record_index)
+
+    def parse(filename: str | Path | BinaryIO, *,
+              columns: Optional[Sequence[str | int]] = None,
+              start: Optional[datetime | float] = None,
+              stop: Optional[datetime | float] = None) -> tuple[list[str], list[array.array]]:
+        def _parse(file_handle: BinaryIO) -> tuple[list[str], list[array.array]]:
+            titles: list[str] = _read_titles(file_handle)
+            channels: list[int] = _channel_indices(titles, columns)
+            record_size: int = _read_record_size(file_handle)
+            if not record_size:
+                return [], []
+            file_handle.seek(0, os.SEEK_END)
+            first_record: int = 0
+            last_record: int = (file_handle.tell() - 0x3000) // record_size  # the last record might be incomplete
+            if start is not None or stop is not None:
+                first_record, last_record = _records_range(file_handle, titles, record_size, last_record,
+                                                           start, stop)
+            file_handle.seek(0x3000 + first_record * record_size)
+            data: array.array = array.array('d')
+            data.fromfile(file_handle, (last_record - first_record) * record_size // data.itemsize)
+            channels = [channel for channel in channels if channel + 1 < record_size // data.itemsize]
+            return [titles[channel] for channel in channels], _split_channels(data, record_size // data.itemsize,
+                                                                              channels, first_record)
+
+        if isinstance(filename, BinaryIO):
+            return _parse(filename)
+        f_in: BinaryIO
+        with (filename.open('rb') if isinstance(filename, Path) else open(filename, 'rb')) as f_in:
+            return _parse(f_in)
+
+
+def iter_chunks(filename: str | Path | BinaryIO, rows_per_chunk: int = 1 << 16, *,
+                columns: Optional[Sequence[str | int]] = None) \
+        -> Iterator[tuple[list[str], NDArray[np.float64] | list[array.array]]]:
+    """
+    Read a log file by blocks of records for the memory used not to depend on the file size
+    :param filename: the name of the file or an opened binary file
+    :param rows_per_chunk: the number of records in a block; the last block might be shorter
+    :param columns: the titles or the indices of the channels to read, all of them by default
+    :return: an iterator over the channel titles and the data blocks, one row per channel
+    """
+    def _iter_chunks(file_handle: BinaryIO) -> Iterator[tuple[list[str], NDArray[np.float64] | list[array.array]]]:
+        titles: list[str] = _read_titles(file_handle)
+        channels: list[int] = _channel_indices(titles, columns)
+        record_size: int = _read_record_size(file_handle)
+        if not record_size:
+            return
+        channels = [channel for channel in channels if channel + 1 < record_size // 8]
+        titles = [titles[channel] for channel in channels]
+        file_handle.seek(0x3000)
+        records_read: int = 0
+        while True:
+            records: bytes = file_handle.read(rows_per_chunk * record_size)
+            if len(records) % record_size:
+                # the last record might be incomplete yet; it's read again with the next block if it gets completed
+                file_handle.seek(-(len(records) % record_size), os.SEEK_CUR)
+                records = records[:(len(records) - len(records) % record_size)]
+            if not records:
+                break
+            yield titles, _decode_records(records, record_size, channels, records_read)
+            records_read += len(records) // record_size
+
+    if rows_per_chunk <= 0:
+        raise ValueError('The number of rows per chunk must be positive')
+    if isinstance(filename, BinaryIO):
+        yield from _iter_chunks(filename)
+        return
+    f_in: BinaryIO
+    with (filename.open('rb') if isinstance(filename, Path) else open(filename, 'rb')) as f_in:
+        yield from _iter_chunks(f_in)
+
+
+class TailReader:
+    """ Read a growing log file record by record, returning only the records added since the previous read """
+
+    def __init__(self, filename: str | Path) -> None:
+        self._filename: Path = Path(filename)
+        self._titles: list[str] = []
+        self._record_size: int = 0  # in bytes, including the size prefix
+        self._offset: int = 0x3000  # right after the last complete record read
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def filename(self) -> Path:
+        return self._filename
+
+    @property
+    def titles(self) -> list[str]:
+        return self._titles
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def skip(self, records_count: int) -> None:
+        """ Mark the next `records_count` records as read without reading them, e.g., when they are cached """
+        with self._lock:
+            f_in: BinaryIO
+            with self._filename.open('rb') as f_in:
+                if not self._titles:
+                    self._titles = _read_titles(f_in)
+                if not self._record_size:
+                    self._record_size = _read_record_size(f_in)
+            self._offset += records_count * self._record_size
+
+    def read(self, progress: Optional[Callable[[int, int], Any]] = None) -> NDArray[np.float64] | list[array.array]:
+        """
+        Read the complete records appended to the file since the previous call;
+        a partly written last record is left for the next call
+        :param progress: a function to call with the number of bytes read so far and the number of bytes to read;
+                         an exception raised in it interrupts the reading and leaves the reader unchanged
+        :return: the new data, one row per channel
+        """
+        with self._lock:
+            f_in: BinaryIO
+            with self._filename.open('rb') as f_in:
+                f_in.seek(0, os.SEEK_END)
+                file_size: int = f_in.tell()
+                if file_size < self._offset:
+                    raise IOError('The file has been truncated')
+                if not self._titles:
+                    self._titles = _read_titles(f_in)
+                if not self._record_size:
+                    self._record_size = _read_record_size(f_in)
+                records_count: int = (file_size - self._offset) // self._record_size if self._record_size else 0
+                records: bytearray = bytearray(records_count * self._record_size)
+                records_view: memoryview = memoryview(records)
+                f_in.seek(self._offset)
+                bytes_read: int = 0
+                while bytes_read < len(records):
+                    chunk_size: int = f_in.readinto(records_view[bytes_read:(bytes_read + _READ_CHUNK_SIZE)])
+                    if not chunk_size:
+                        raise IOError('The file has been truncated')
+                    bytes_read += chunk_size
+                    if progress is not None:
+                        progress(bytes_read, len(records))
+                records_view.release()
+            # the channels are a view of `records`, not a copy, for the memory used not to double for a moment;
+            # the record size prefixes are kept along, which costs a channel
+            data: NDArray[np.float64] | list[array.array] = _decode_records(
+                records, self._record_size or (len(self._titles) + 1) * 8, range(len(self._titles)),
+                (self._offset - 0x3000) // self._record_size if self._record_size else 0, copy=False)
+            self._offset += len(records)
+            return data
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import operator
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from log_parser._parser import TailReader, _time_channel, parse
+
+__all__ = ['ChunkedColumn', 'ChunkedArray', 'parse_files', 'SessionReader']
+
+
+class ChunkedColumn:
+    """
+    A read-only 1D array made of several arrays without joining them
+
+    Slicing it and indexing it with an integer or with an array of indices give NumPy arrays,
+    copying only the values requested, unless a slice lies within a chunk, then it's a view of the chunk.
+    `np.asarray` joins the chunks.
+    """
+
+    def __init__(self, chunks: Sequence[NDArray[np.float64]]) -> None:
+        self._chunks: list[NDArray[np.float64]] = list(chunks)
+        chunk: NDArray[np.float64]
+        self._ends: NDArray[np.intp] = np.cumsum([chunk.size for chunk in self._chunks], dtype=np.intp)
+        self._starts: NDArray[np.intp] = self._ends - [chunk.size for chunk in self._chunks]
+
+    @property
+    def chunks(self) -> list[NDArray[np.float64]]:
+        return self._chunks
+
+    @property
+    def size(self) -> int:
+        return int(self._ends[-1]) if self._chunks else 0
+
+    @property
+    def shape(self) -> tuple[int]:
+        return self.size,
+
+    @property
+    def ndim(self) -> int:
+        return 1
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None) -> NDArray[np.float64]:
+        if not self._chunks:
+            return np.empty(0, dtype=dtype or np.float64)
+        return np.concatenate(self._chunks).astype(dtype or np.float64, copy=False)
+
+    def __getitem__(self, index: int | slice | Sequence[int] | NDArray[np.integer]) -> np.float64 | NDArray[np.float64]:
+        if isinstance(index, slice):
+            start: int
+            stop: int
+            step: int
+            start, stop, step = index.indices(self.size)
+            if step != 1:
+                return self[np.arange(start, stop, step)]
+            if start >= stop:
+                return np.empty(0, dtype=np.float64)
+            first_chunk: int = int(np.searchsorted(self._ends, start, side='right'))
+            last_chunk: int = int(np.searchsorted(self._ends, stop - 1, side='right'))
+            if first_chunk == last_chunk:
+                return self._chunks[first_chunk][start - self._starts[first_chunk]:stop - self._starts[first_chunk]]
+            chunk_index: int
+            return np.concatenate([self._chunks[chunk_index][max(0, start - self._starts[chunk_index]):
+                                                             stop - self._starts[chunk_index]]
+                                   for chunk_index in range(first_chunk, last_chunk + 1)])
+        if np.ndim(index) == 0:
+            position: int = operator.index(index)
+            if position < 0:
+                position += self.size
+            if not 0 <= position < self.size:
+                raise IndexError(f'index {index} is out of bounds for size {self.size}')
+            chunk_index = int(np.searchsorted(self._ends, position, side='right'))
+            return self._chunks[chunk_index][position - self._starts[chunk_index]]
+        indices: NDArray[np.intp] = np.asarray(index)
+        if indices.dtype == np.bool_:
+            indices = np.flatnonzero(indices)
+        indices = np.where(indices < 0, indices + self.size, indices)
+        if indices.size and not (0 <= indices.min() and indices.max() < self.size):
+            raise IndexError(f'index is out of bounds for size {self.size}')
+        chunk_indices: NDArray[np.intp] = np.searchsorted(self._ends, indices, side='right')
+        values: NDArray[np.float64] = np.empty(indices.shape, dtype=np.float64)
+        for chunk_index in np.unique(chunk_indices).tolist():
+            in_chunk: NDArray[np.bool] = chunk_indices == chunk_index
+            values[in_chunk] = self._chunks[chunk_index][indices[in_chunk] - self._starts[chunk_index]]
+        return values
+
+
+class ChunkedArray:
+    """ A read-only 2D array of the channels of several log files, one `ChunkedColumn` per channel """
+
+    def __init__(self, columns: Sequence[ChunkedColumn]) -> None:
+        self._columns: list[ChunkedColumn] = list(columns)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._columns), (self._columns[0].size if self._columns else 0)
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __iter__(self) -> Iterator[ChunkedColumn]:
+        return iter(self._columns)
+
+    def __array__(self, dtype: Optional[np.dtype] = None, copy: Optional[bool] = None) -> NDArray[np.float64]:
+        column: ChunkedColumn
+        return np.array([np.asarray(column) for column in self._columns], dtype=dtype or np.float64).reshape(self.shape)
+
+    def __getitem__(self, index: int | Sequence[int]) -> ChunkedColumn | ChunkedArray:
+        if np.ndim(index) == 0:
+            return self._columns[operator.index(index)]
+        i: int
+        return ChunkedArray([self._columns[i] for i in index])
+
+
+def _align(titles: list[str], file_titles: list[str], data: NDArray[np.float64]) -> list[NDArray[np.float64]]:
+    """ Arrange the channels of a file by `titles`, the channels missing in the file being NaN without storing them """
+    rows_count: int = data.shape[1] if data.ndim == 2 else 0
+    title: str
+    return [(data[file_titles.index(title)] if title in file_titles
+             else np.broadcast_to(np.float64(np.nan), (rows_count,)))
+            for title in titles]
+
+
+def _parse_files(filenames: Sequence[str | Path], workers: Optional[int],
+                 progress: Optional[Callable[[int, int], Any]]) -> tuple[list[str], ChunkedArray, list[Path]]:
+    """ Do `parse_files`, returning also the names of the files with records in the order of their data """
+    paths: list[Path] = [Path(filename) for filename in filenames]
+    path: Path
+    sizes: dict[Path, int] = {path: path.stat().st_size for path in paths}
+    parsed: dict[Path, tuple[list[str], NDArray[np.float64]]] = {}
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures: dict[Future[tuple[list[str], NDArray[np.float64]]], Path] = {executor.submit(parse, path): path
+                                                                              for path in paths}
+        future: Future[tuple[list[str], NDArray[np.float64]]]
+        for future in as_completed(futures):
+            parsed[futures[future]] = future.result()
+            if progress is not None:
+                progress(sum(sizes[path] for path in parsed), sum(sizes.values()))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def first_timestamp(file_path: Path) -> float:
+        file_titles: list[str]
+        file_data: NDArray[np.float64]
+        file_titles, file_data = parsed[file_path]
+        time_channel: Optional[int] = _time_channel(file_titles)
+        return float(file_data[time_channel, 0]) if time_channel is not None else np.inf
+
+    paths = sorted((path for path in paths if parsed[path][1].size), key=first_timestamp)
+    titles: list[str] = []
+    title: str
+    for path in paths:
+        titles.extend(title for title in parsed[path][0] if title not in titles)
+    segments: list[list[NDArray[np.float64]]] = [_align(titles, *parsed[path]) for path in paths]
+    channel: int
+    segment: list[NDArray[np.float64]]
+    return titles, ChunkedArray([ChunkedColumn([segment[channel] for segment in segments])
+                                 for channel in range(len(titles))]), paths
+
+
+def parse_files(filenames: Sequence[str | Path], *, workers: Optional[int] = None,
+                progress: Optional[Callable[[int, int], Any]] = None) -> tuple[list[str], ChunkedArray]:
+    """
+    Read several log files, e.g., the consecutive logs of a cooldown, as a single log, in parallel threads
+
+    The channels are matched by their titles, so their order might differ from file to file,
+    and a channel missing in a file is NaN there.
+    The files are arranged by their first timestamps; the files without records are skipped.
+    The data of the files is not joined, see `ChunkedArray`.
+    :param filenames: the names of the files
+    :param workers: the number of the files read at once, the default of `ThreadPoolExecutor` if None
+    :param progress: a function to call with the number of bytes read and the total number of bytes to read
+                     after every file; an exception raised in it stops the reading
+    :return: the channel titles, the ones of the earliest file first, and the data, one row per channel
+    """
+    titles: list[str]
+    data: ChunkedArray
+    titles, data, _ = _parse_files(filenames, workers, progress)
+    return titles, data
+
+
+class SessionReader:
+    """
+    Read several log files as a single one, following the last of them, see `parse_files`
+
+    It can be used in place of `TailReader`: the first read gives all the data as a `ChunkedArray`,
+    and the next ones give the records appended to the latest file since, arranged by the session titles.
+    """
+
+    def __init__(self, filenames: Sequence[str | Path], workers: Optional[int] = None) -> None:
+        self._filenames: list[Path] = [Path(filename) for filename in filenames]
+        self._workers: Optional[int] = workers
+        self._titles: list[str] = []
+        self._tail_reader: Optional[TailReader] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def filenames(self) -> list[Path]:
+        return self._filenames
+
+    @property
+    def filename(self) -> Path:
+        """ The latest file, the one to follow """
+        if self._tail_reader is not None:
+            return self._tail_reader.filename
+        return self._filenames[-1]
+
+    @property
+    def titles(self) -> list[str]:
+        return self._titles
+
+    def read(self, progress: Optional[Callable[[int, int], Any]] = None) -> ChunkedArray | NDArray[np.float64]:
+        """
+        Read all the files on the first call and the records appended to the latest file on the next calls
+        :param progress: a function to call with the number of bytes read so far and the number of bytes to read;
+                         an exception raised in it interrupts the reading and leaves the reader unchanged
+        :return: the new data, one row per channel
+        """
+        with self._lock:
+            if self._tail_reader is None:
+                titles: list[str]
+                data: ChunkedArray
+                paths: list[Path]
+                titles, data, paths = _parse_files(self._filenames, self._workers, progress)
+                if not paths:
+                    if not self._filenames:
+                        return np.empty((0, 0))
+                    # no file has records yet, so follow the last one from its start
+                    self._tail_reader = TailReader(self._filenames[-1])
+                    self._tail_reader.skip(0)  # to know the titles
+                    self._titles = self._tail_reader.titles
+                    return np.empty((len(self._titles), 0))
+                self._titles = titles
+                # follow the latest file from its records read
+                self._tail_reader = TailReader(paths[-1])
+                self._tail_reader.skip(data[0].chunks[-1].size)
+                return data
+            new_data: NDArray[np.float64] = np.asarray(self._tail_reader.read(progress))
+            if not new_data.size:
+                return np.empty((len(self._titles), 0))
+            return np.array(_align(self._titles, self._tail_reader.titles, new_data))
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import BinaryIO, Final, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from log_parser._parser import _channel_indices, _find_faulty_records, _read_record_size, _read_titles
+
+__all__ = ['SharedLog', 'parse_many']
+
+_READ_BLOCK_SIZE: Final[int] = 1 << 24  # bytes read at once by a worker
+
+
+class SharedLog:
+    """
+    A log file decoded into a block of shared memory by `parse_many`
+
+    The data is a view of the block, so it's valid until `close` is called.
+    The block is removed then, so close the log when done with it, or use it as a context manager.
+    """
+
+    def __init__(self, filename: Path, titles: list[str], shared_memory: Optional[SharedMemory],
+                 rows_count: int) -> None:
+        self._filename: Path = filename
+        self._titles: list[str] = titles
+        self._shared_memory: Optional[SharedMemory] = shared_memory
+        self._data: NDArray[np.float64] = np.empty((len(titles), rows_count), dtype=np.float64)
+        if shared_memory is not None:
+            self._data = np.ndarray((len(titles), rows_count), dtype=np.float64, buffer=shared_memory.buf)
+
+    def __enter__(self) -> SharedLog:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @property
+    def filename(self) -> Path:
+        return self._filename
+
+    @property
+    def titles(self) -> list[str]:
+        return self._titles
+
+    @property
+    def data(self) -> NDArray[np.float64]:
+        """ The data, one row per channel """
+        return self._data
+
+    @property
+    def name(self) -> Optional[str]:
+        """ The name of the shared memory block, or None if there is no data """
+        return self._shared_memory.name if self._shared_memory is not None else None
+
+    def close(self) -> None:
+        """ Free the shared memory; the views of `data` must not be used afterwards """
+        if self._shared_memory is not None:
+            self._data = np.empty((len(self._titles), 0), dtype=np.float64)
+            self._shared_memory.close()
+            self._shared_memory.unlink()
+            self._shared_memory = None
+
+
+def _read_layout(filename: Path, columns: Optional[Sequence[str | int]]) -> tuple[list[str], list[int], int, int]:
+    """
+    Read the header of a log file
+    :return: the titles and the indices of the channels requested, the record size, and the number of records
+    """
+    f_in: BinaryIO
+    with filename.open('rb') as f_in:
+        titles: list[str] = _read_titles(f_in)
+        channels: list[int] = _channel_indices(titles, columns)
+        record_size: int = _read_record_size(f_in)
+        if not record_size:
+            return [], [], 0, 0
+        f_in.seek(0, os.SEEK_END)
+        records_count: int = (f_in.tell() - 0x3000) // record_size  # the last record might be incomplete
+    channels = [channel for channel in channels if channel + 1 < record_size // 8]
+    return [titles[channel] for channel in channels], channels, record_size, records_count
+
+
+def _decode_into_shared_memory(filename: Path, name: str, channels: list[int], record_size: int,
+                               records_count: int) -> None:
+    """ Decode the first `records_count` records of a log file into the block of shared memory named `name` """
+    shared_memory: SharedMemory = SharedMemory(name)
+    try:
+        # noinspection PyTypeChecker
+        dt: np.dtype = np.dtype(np.float64).newbyteorder('<')
+        data_item_size: int = record_size // dt.itemsize
+        data: NDArray[np.float64] = np.ndarray((len(channels), records_count), dtype=np.float64,
+                                               buffer=shared_memory.buf)
+        # the records are read by blocks, and the channels are copied from them right into the shared memory
+        block_records_count: int = max(1, _READ_BLOCK_SIZE // record_size)
+        block: bytearray = bytearray(block_records_count * record_size)
+        block_view: memoryview = memoryview(block)
+        f_in: BinaryIO
+        with filename.open('rb') as f_in:
+            f_in.seek(0x3000)
+            start: int
+            for start in range(0, records_count, block_records_count):
+                count: int = min(block_records_count, records_count - start)
+                if f_in.readinto(block_view[:count * record_size]) < count * record_size:
+                    raise IOError('The file has been truncated')
+                records: NDArray[np.float64] = np.frombuffer(block, dtype=dt, count=count * data_item_size)
+                faulty_records: NDArray[np.intp] = _find_faulty_records(records, data_item_size)
+                if faulty_records.size:
+                    raise RuntimeError('Inconsistent data: some records are faulty', faulty_records + start)
+                records = records.reshape((data_item_size, -1), order='F')
+                index: int
+                channel: int
+                for index, channel in enumerate(channels):
+                    data[index, start:start + count] = records[channel + 1]
+        del data  # the block can't be closed while it's viewed
+    finally:
+        shared_memory.close()
+
+
+def parse_many(filenames: Sequence[str | Path], *, workers: Optional[int] = None,
+               columns: Optional[Sequence[str | int]] = None) -> list[SharedLog]:
+    """
+    Read many log files in parallel processes, like `parse` does for one file
+
+    The blocks of shared memory for the data are made here, after the headers of the files,
+    and the processes decode the files right into them, so the data is not copied between the processes.
+    :param filenames: the names of the files
+    :param workers: the number of the processes, the number of processors by default
+    :param columns: the titles or the indices of the channels to read from every file, all of them by default
+    :return: the files read, in the order of `filenames`; close them to free the memory
+    """
+    paths: list[Path] = [Path(filename) for filename in filenames]
+    path: Path
+    logs: list[SharedLog] = []
+    log: SharedLog
+    try:
+        layouts: list[tuple[list[str], list[int], int, int]] = []
+        layout: tuple[list[str], list[int], int, int]
+        for path in paths:
+            layout = _read_layout(path, columns)
+            layouts.append(layout)
+            logs.append(SharedLog(path, layout[0],
+                                  # this process keeps the block open till the log is closed, for on Windows,
+                                  # the block is gone as soon as no process has it open
+                                  SharedMemory(create=True, size=len(layout[1]) * layout[3] * 8)
+                                  if layout[1] and layout[3] else None,
+                                  layout[3]))
+        # on POSIX, the workers are to share the resource tracker of this process,
+        # for otherwise each of them would start its own, which would remove the blocks as soon as the worker exits
+        resource_tracker.ensure_running()
+        executor: ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(paths) or 1)) as executor:
+            futures: list[Future[None]] = [executor.submit(_decode_into_shared_memory,
+                                                           log.filename, log.name, layout[1], layout[2], layout[3])
+                                           for log, layout in zip(logs, layouts) if log.name is not None]
+            future: Future[None]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)  # do not decode the other files in vain
+                raise
+    except BaseException:
+        for log in logs:
+            log.close()
+        raise
+    return logs